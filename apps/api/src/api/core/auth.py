@@ -1,28 +1,125 @@
 """Authentication and authorization utilities."""
 
+import asyncio
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional
+from functools import lru_cache
+from typing import NamedTuple, NoReturn, Optional, Tuple
 from uuid import UUID
 
 import jwt
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from api.core.config import get_settings
+from api.core.config import settings
 from api.core.database import get_db
-from api.models.user import User, UserWorkspace
+from api.models.user import User, UserRole, UserWorkspace
 
-settings = get_settings()
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+class AuthUser(NamedTuple):
+    """Columns of the authenticated user that request handlers rely on."""
+    id: UUID
+    email: str
+    is_active: bool
+
+
+class AuthWorkspace(NamedTuple):
+    """The authenticated user's workspace membership."""
+    id: UUID
+    user_id: UUID
+    workspace_id: UUID
+    role: UserRole
+
+
+# Columns selected for AuthUser / AuthWorkspace, in field order
+_AUTH_USER_COLS = (User.id, User.email, User.is_active)
+_AUTH_WORKSPACE_COLS = (
+    UserWorkspace.id,
+    UserWorkspace.user_id,
+    UserWorkspace.workspace_id,
+    UserWorkspace.role,
+)
+_AUTH_USER_WIDTH = len(_AUTH_USER_COLS)
+
+# argon2id for new hashes; legacy bcrypt hashes still verify and are flagged
+# by password_needs_rehash() so login can upgrade them
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=settings.argon2_time_cost,
+    argon2__memory_cost=settings.argon2_memory_cost,
+    argon2__parallelism=settings.argon2_parallelism,
+)
+
+# Dedicated pool for the KDF so password bursts cannot starve the default
+# executor used by other to_thread() callers
+_kdf_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 1,
+    thread_name_prefix="kdf",
+)
 security = HTTPBearer()
 
+# Decoded token payloads keyed by the raw bearer token. Entries never outlive
+# the token's own lifetime; expired payloads are also evicted on lookup.
+_token_cache: TTLCache = TTLCache(
+    maxsize=10_000,
+    ttl=settings.jwt_expire_minutes * 60,
+)
+
+# Short-lived cache of authenticated users (AuthUser tuples) keyed by user id. Call
+# invalidate_user_cache() whenever a user row is modified.
+_user_cache: TTLCache = TTLCache(maxsize=4096, ttl=30)
+
+# Auth failures are raised often (and repeatedly under token floods), so the
+# exception objects are built once. Raise them via _raise() so each raise
+# starts with a fresh traceback.
+_INVALID_CREDENTIALS_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Could not validate credentials",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_USER_NOT_FOUND_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="User not found",
+    headers={"WWW-Authenticate": "Bearer"},
+)
+_INACTIVE_USER_EXC = HTTPException(
+    status_code=status.HTTP_401_UNAUTHORIZED,
+    detail="Inactive user",
+)
+_NO_WORKSPACE_EXC = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="No workspace access",
+)
+_INSUFFICIENT_PERMISSIONS_EXC = HTTPException(
+    status_code=status.HTTP_403_FORBIDDEN,
+    detail="Insufficient permissions",
+)
+
+
+def _raise(exc: HTTPException) -> NoReturn:
+    """Raise a shared exception instance without accumulating tracebacks."""
+    raise exc.with_traceback(None)
+
+
+async def verify_password(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password against its hash without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(
+        _kdf_executor, pwd_context.verify, plain_password, hashed_password
+    )
+
 
-def verify_password(plain_password: str, hashed_password: str) -> bool:
-    """Verify a password against its hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Check whether a hash uses a deprecated scheme (bcrypt) or outdated parameters."""
+    return pwd_context.needs_update(hashed_password)
 
 
 def get_password_hash(password: str) -> str:
@@ -30,6 +127,12 @@ def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
 
+async def hash_password(password: str) -> str:
+    """Hash a password without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_kdf_executor, pwd_context.hash, password)
+
+
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -45,82 +148,130 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
 
 def verify_token(token: str) -> dict:
     """Verify and decode a JWT token."""
+    payload = _token_cache.get(token)
+    if payload is not None:
+        exp = payload.get("exp")
+        if exp is None or exp > time.time():
+            return payload
+        _token_cache.pop(token, None)
+    
     try:
         payload = jwt.decode(token, settings.jwt_secret_key, algorithms=[settings.jwt_algorithm])
-        return payload
     except jwt.PyJWTError:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        _raise(_INVALID_CREDENTIALS_EXC)
+    
+    _token_cache[token] = payload
+    return payload
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    """Get the current authenticated user."""
-    payload = verify_token(credentials.credentials)
-    user_id: str = payload.get("sub")
-    if user_id is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Could not validate credentials",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
-    
-    # Get user from database
-    result = await db.execute(select(User).where(User.id == UUID(user_id)))
-    user = result.scalar_one_or_none()
+def invalidate_token(token: str) -> None:
+    """Drop a token from the verification cache (e.g. on logout)."""
+    _token_cache.pop(token, None)
+
+
+def clear_token_cache() -> None:
+    """Drop all cached token payloads (e.g. after rotating the JWT secret)."""
+    _token_cache.clear()
+
+
+async def _get_user_cached(db: AsyncSession, user_id: UUID) -> Optional[AuthUser]:
+    """Get a user by id, serving recent lookups from the in-process cache."""
+    user = _user_cache.get(user_id)
+    if user is not None:
+        return user
     
+    # Cache immutable column tuples, never ORM rows bound to this request's session
+    result = await db.execute(select(*_AUTH_USER_COLS).where(User.id == user_id))
+    row = result.first()
+    if row is None:
+        return None
+    user = _user_cache[user_id] = AuthUser(*row)
+    return user
+
+
+def invalidate_user_cache(user_id: UUID) -> None:
+    """Drop a user from the lookup cache after it has been modified."""
+    _user_cache.pop(user_id, None)
+
+
+@lru_cache(maxsize=10_000)
+def _parse_user_id(sub: str) -> UUID:
+    """Parse a ``sub`` claim into a UUID, memoized per distinct subject."""
+    return UUID(sub)
+
+
+def _get_token_user_id(credentials: HTTPAuthorizationCredentials) -> UUID:
+    """Extract the user id from the bearer token's ``sub`` claim."""
+    payload = verify_token(credentials.credentials)
+    user_id: Optional[str] = payload.get("sub")
+    try:
+        return _parse_user_id(user_id)
+    except (AttributeError, TypeError, ValueError):
+        _raise(_INVALID_CREDENTIALS_EXC)
+
+
+def _check_user(user: Optional[AuthUser]) -> AuthUser:
+    """Reject missing or inactive users."""
     if user is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="User not found",
-            headers={"WWW-Authenticate": "Bearer"},
-        )
+        _raise(_USER_NOT_FOUND_EXC)
     
     if not user.is_active:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail="Inactive user",
-        )
+        _raise(_INACTIVE_USER_EXC)
     
     return user
 
 
-async def get_current_workspace(
-    user: User = Depends(get_current_user),
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
     db: AsyncSession = Depends(get_db),
-) -> UserWorkspace:
-    """Get the current user's workspace context."""
+) -> AuthUser:
+    """Get the current authenticated user."""
+    user_id = _get_token_user_id(credentials)
+    
+    # Get user from cache or database
+    user = await _get_user_cached(db, user_id)
+    
+    return _check_user(user)
+
+
+async def get_current_user_and_workspace(
+    credentials: HTTPAuthorizationCredentials = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> Tuple[AuthUser, AuthWorkspace]:
+    """Get the current user and workspace context in a single query."""
+    user_id = _get_token_user_id(credentials)
+    
     # For now, get the first workspace the user belongs to
     # In a full implementation, this would be determined by request context
     result = await db.execute(
-        select(UserWorkspace)
-        .where(UserWorkspace.user_id == user.id)
+        select(*_AUTH_USER_COLS, *_AUTH_WORKSPACE_COLS)
+        .outerjoin(UserWorkspace, UserWorkspace.user_id == User.id)
+        .where(User.id == user_id)
         .limit(1)
     )
-    user_workspace = result.scalar_one_or_none()
+    row = result.first()
     
-    if user_workspace is None:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="No workspace access",
-        )
+    user = _check_user(AuthUser(*row[:_AUTH_USER_WIDTH]) if row is not None else None)
+    _user_cache[user_id] = user
     
-    return user_workspace
+    if row[_AUTH_USER_WIDTH] is None:
+        _raise(_NO_WORKSPACE_EXC)
+    
+    return user, AuthWorkspace(*row[_AUTH_USER_WIDTH:])
+
+
+async def get_current_workspace(
+    context: Tuple[AuthUser, AuthWorkspace] = Depends(get_current_user_and_workspace),
+) -> AuthWorkspace:
+    """Get the current user's workspace context."""
+    return context[1]
 
 
 def require_role(required_role: str):
     """Decorator to require a specific role."""
-    def role_checker(user_workspace: UserWorkspace = Depends(get_current_workspace)):
+    def role_checker(user_workspace: AuthWorkspace = Depends(get_current_workspace)):
         if user_workspace.role.value not in [required_role, "owner", "admin"]:
-            raise HTTPException(
-                status_code=status.HTTP_403_FORBIDDEN,
-                detail="Insufficient permissions",
-            )
+            _raise(_INSUFFICIENT_PERMISSIONS_EXC)
         return user_workspace
     
     return role_checker
@@ -1,21 +1,44 @@
 """Database configuration and utilities."""
 
-from typing import AsyncGenerator
+import asyncio
+import contextlib
+import os
+import time
+from enum import Enum
+from typing import Any, AsyncGenerator, Dict, Optional, Type
+from uuid import UUID
 
-from sqlalchemy import MetaData
+import structlog
+
+from sqlalchemy import Enum as SQLEnum, MetaData, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import DeclarativeBase
 
-from api.core.config import get_settings
+from api.core.config import settings
+
+logger = structlog.get_logger()
+
+# Interval between background database pings, in seconds
+DB_HEARTBEAT_INTERVAL = 5.0
 
-settings = get_settings()
 
 # Create async engine
 engine = create_async_engine(
     settings.database_url,
     echo=settings.debug,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
     pool_pre_ping=True,
     pool_recycle=300,
+    pool_timeout=settings.db_pool_timeout,
+    # Rows per multi-row INSERT ... VALUES statement when batching executemany
+    use_insertmanyvalues=True,
+    insertmanyvalues_page_size=settings.db_insert_page_size,
+    connect_args={
+        # JIT compilation only pays off for long analytical queries
+        "server_settings": {"jit": "off", "application_name": "ai_venture_api"},
+        "command_timeout": settings.db_command_timeout,
+    },
 )
 
 # Create session factory
@@ -37,6 +60,39 @@ metadata = MetaData(
 )
 
 
+def uuid7() -> UUID:
+    """Generate a time-ordered UUIDv7 (RFC 9562) for primary keys.
+    
+    The leading 48-bit millisecond timestamp keeps new keys at the right edge
+    of B-tree indexes instead of scattering inserts across random leaf pages.
+    """
+    timestamp_ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), "big")
+    value = (
+        (timestamp_ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76
+        | (rand >> 62 & 0xFFF) << 64
+        | 0b10 << 62
+        | rand & 0x3FFF_FFFF_FFFF_FFFF
+    )
+    return UUID(int=value)
+
+
+def string_enum(enum_class: Type[Enum]) -> SQLEnum:
+    """Map a Python enum onto VARCHAR guarded by a CHECK constraint.
+    
+    Unlike a native PostgreSQL ENUM type, new members only need the CHECK
+    constraint replaced, which runs inside an ordinary migration transaction.
+    """
+    return SQLEnum(
+        enum_class,
+        native_enum=False,
+        create_constraint=True,
+        length=32,
+        validate_strings=False,
+    )
+
+
 class Base(DeclarativeBase):
     """Base class for all database models."""
     
@@ -60,4 +116,57 @@ async def init_db() -> None:
     # Create tables (in production, use Alembic migrations)
     if settings.environment == "development":
         async with engine.begin() as conn:
+            await conn.execute(text("CREATE EXTENSION IF NOT EXISTS vector"))
             await conn.run_sync(Base.metadata.create_all)
+
+
+# Last known database state, refreshed by the heartbeat task
+_DB_STATE: Dict[str, Any] = {"status": "unknown", "database": "unknown", "checked_at": None}
+_heartbeat_task: Optional[asyncio.Task] = None
+
+
+async def ping_db() -> Dict[str, Any]:
+    """Ping the database once and record the result in the shared state."""
+    try:
+        async with engine.connect() as conn:
+            await conn.execute(text("SELECT 1"))
+        _DB_STATE.update(status="healthy", database="connected", checked_at=time.time())
+        _DB_STATE.pop("error", None)
+    except Exception as e:
+        _DB_STATE.update(
+            status="unhealthy",
+            database="disconnected",
+            checked_at=time.time(),
+            error=str(e),
+        )
+    return _DB_STATE
+
+
+async def _db_heartbeat() -> None:
+    """Refresh the cached database state every heartbeat interval."""
+    while True:
+        await ping_db()
+        await asyncio.sleep(DB_HEARTBEAT_INTERVAL)
+
+
+def get_db_state() -> Dict[str, Any]:
+    """Get the most recent database state recorded by the heartbeat."""
+    return _DB_STATE
+
+
+def start_db_heartbeat() -> None:
+    """Start the background database heartbeat task."""
+    global _heartbeat_task
+    if _heartbeat_task is None or _heartbeat_task.done():
+        _heartbeat_task = asyncio.create_task(_db_heartbeat())
+        logger.info("Database heartbeat started", interval=DB_HEARTBEAT_INTERVAL)
+
+
+async def stop_db_heartbeat() -> None:
+    """Cancel the background database heartbeat task."""
+    global _heartbeat_task
+    if _heartbeat_task is not None:
+        _heartbeat_task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await _heartbeat_task
+        _heartbeat_task = None
@@ -0,0 +1,48 @@
+"""Keyset (cursor) pagination helpers."""
+
+import base64
+import binascii
+from datetime import datetime
+from typing import Any, Optional, Sequence, Tuple
+from uuid import UUID
+
+from sqlalchemy import tuple_
+from sqlalchemy.sql.elements import ColumnElement
+
+from api.core.exceptions import ValidationError
+
+
+def encode_cursor(created_at: datetime, row_id: UUID) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor."""
+    raw = f"{created_at.isoformat()}|{row_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, UUID]:
+    """Decode a cursor produced by ``encode_cursor``."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        created_at, row_id = raw.split("|", 1)
+        return datetime.fromisoformat(created_at), UUID(row_id)
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        raise ValidationError("Invalid pagination cursor")
+
+
+def keyset_condition(
+    created_at_col: Any,
+    id_col: Any,
+    cursor: Optional[str],
+) -> Optional[ColumnElement[bool]]:
+    """Build the ``(created_at, id) < cursor`` predicate for newest-first pages."""
+    if not cursor:
+        return None
+    created_at, row_id = decode_cursor(cursor)
+    return tuple_(created_at_col, id_col) < tuple_(created_at, row_id)
+
+
+def next_cursor(rows: Sequence[Any], per_page: int) -> Optional[str]:
+    """Return the cursor for the following page when more rows were fetched."""
+    if len(rows) <= per_page:
+        return None
+    last = rows[per_page - 1]
+    return encode_cursor(last.created_at, last.id)
@@ -1,16 +1,15 @@
 """Role-Based Access Control using Casbin."""
 
-import os
+import asyncio
 from typing import List, Optional
 
 import casbin
 from casbin_sqlalchemy_adapter import Adapter
+from sqlalchemy import create_engine, make_url
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from api.core.config import get_settings
-from api.core.database import engine
+from api.core.config import settings
 
-settings = get_settings()
 
 # Casbin model configuration
 CASBIN_MODEL = """
@@ -40,16 +39,17 @@ class RBACManager:
     
     async def initialize(self):
         """Initialize the RBAC system."""
-        # Create Casbin adapter
-        self.adapter = Adapter(engine.sync_engine)
+        # Casbin's adapter runs blocking queries, so it gets its own sync
+        # engine rather than the asyncpg one
+        url = make_url(settings.database_url).set(drivername="postgresql+psycopg")
+        self.adapter = Adapter(create_engine(url, pool_size=2, pool_pre_ping=True))
         
-        # Create model file
-        model_path = "/tmp/casbin_model.conf"
-        with open(model_path, "w") as f:
-            f.write(CASBIN_MODEL)
+        # Load model straight from the in-memory definition
+        model = casbin.Model()
+        model.load_model_from_text(CASBIN_MODEL)
         
-        # Create enforcer
-        self.enforcer = casbin.Enforcer(model_path, self.adapter)
+        # Create enforcer; this loads the stored policy off the event loop
+        self.enforcer = await asyncio.to_thread(casbin.Enforcer, model, self.adapter)
         
         # Load default policies
         await self.load_default_policies()
@@ -60,8 +60,10 @@ class RBACManager:
             return
         
         # Define role hierarchy
-        self.enforcer.add_grouping_policy("admin", "member")
-        self.enforcer.add_grouping_policy("owner", "admin")
+        grouping_policies = [
+            ["admin", "member"],
+            ["owner", "admin"],
+        ]
         
         # Define permissions for different resources
         resources = [
@@ -71,27 +73,42 @@ class RBACManager:
         actions = ["read", "write", "delete", "admin"]
         
         # Owner can do everything
-        for resource in resources:
-            for action in actions:
-                self.enforcer.add_policy("owner", resource, action)
+        policies = [
+            ["owner", resource, action]
+            for resource in resources
+            for action in actions
+        ]
         
         # Admin can read/write but not admin actions on users/workspaces
         for resource in resources:
             if resource in ["users", "workspaces"]:
-                self.enforcer.add_policy("admin", resource, "read")
-                self.enforcer.add_policy("admin", resource, "write")
+                admin_actions = ["read", "write"]
             else:
-                for action in ["read", "write", "delete"]:
-                    self.enforcer.add_policy("admin", resource, action)
+                admin_actions = ["read", "write", "delete"]
+            policies.extend(["admin", resource, action] for action in admin_actions)
         
         # Member can read/write their own data
         for resource in ["signals", "ideas", "reports"]:
-            self.enforcer.add_policy("member", resource, "read")
-            self.enforcer.add_policy("member", resource, "write")
+            policies.append(["member", resource, "read"])
+            policies.append(["member", resource, "write"])
         
         # Viewer can only read
-        for resource in resources:
-            self.enforcer.add_policy("viewer", resource, "read")
+        policies.extend(["viewer", resource, "read"] for resource in resources)
+        
+        # Casbin rejects a whole batch if any rule already exists, so only
+        # submit the missing ones
+        new_grouping = [
+            rule for rule in grouping_policies
+            if not self.enforcer.has_grouping_policy(*rule)
+        ]
+        if new_grouping:
+            self.enforcer.add_grouping_policies(new_grouping)
+        
+        new_policies = [
+            rule for rule in policies if not self.enforcer.has_policy(*rule)
+        ]
+        if new_policies:
+            self.enforcer.add_policies(new_policies)
         
         # Save policies
         self.enforcer.save_policy()
@@ -0,0 +1,26 @@
+"""Custom response classes."""
+
+from typing import Any
+
+import msgspec
+import numpy as np
+from fastapi.responses import JSONResponse
+
+
+def _enc_hook(obj: Any) -> Any:
+    """Encode values msgspec has no native support for (numpy arrays and scalars)."""
+    if isinstance(obj, np.ndarray):
+        return obj.tolist()
+    if isinstance(obj, np.generic):
+        return obj.item()
+    raise NotImplementedError(f"Objects of type {type(obj)} are not supported")
+
+
+_encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+
+class MsgspecResponse(JSONResponse):
+    """JSON response encoded with msgspec, for msgspec Structs and plain containers."""
+    
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
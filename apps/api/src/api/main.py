@@ -2,20 +2,34 @@
 
 import logging
 from contextlib import asynccontextmanager
-from typing import AsyncGenerator
+from typing import Any, AsyncGenerator
 
+import orjson
 import structlog
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import ORJSONResponse
+from opentelemetry import trace
+from opentelemetry.exporter.otlp.proto.grpc.trace_exporter import OTLPSpanExporter
 from opentelemetry.instrumentation.fastapi import FastAPIInstrumentor
-from prometheus_client import generate_latest, CONTENT_TYPE_LATEST
-from starlette.responses import Response
+from opentelemetry.sdk.resources import SERVICE_NAME, Resource
+from opentelemetry.sdk.trace import TracerProvider
+from opentelemetry.sdk.trace.export import BatchSpanProcessor
+from prometheus_client import make_asgi_app
 
-from api.core.config import get_settings
-from api.core.database import init_db
+from api.core.config import settings
+from api.core.database import init_db, start_db_heartbeat, stop_db_heartbeat
 from api.core.exceptions import APIException
+from api.core.rbac import rbac_manager
+from api.middleware.monitoring import MonitoringMiddleware
 from api.routes import health, auth, signals, ideas, exports, search
+from api.services.search import search_service
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """Serialize log events with orjson for structlog's JSONRenderer."""
+    return orjson.dumps(obj, **kwargs).decode()
+
 
 # Configure structured logging
 structlog.configure(
@@ -28,7 +42,7 @@ structlog.configure(
         structlog.processors.StackInfoRenderer(),
         structlog.processors.format_exc_info,
         structlog.processors.UnicodeDecoder(),
-        structlog.processors.JSONRenderer()
+        structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     ],
     context_class=dict,
     logger_factory=structlog.stdlib.LoggerFactory(),
@@ -38,6 +52,24 @@ structlog.configure(
 logger = structlog.get_logger()
 
 
+def configure_tracing() -> None:
+    """Install a tracer provider that exports spans in background batches."""
+    if isinstance(trace.get_tracer_provider(), TracerProvider):
+        return
+    
+    provider = TracerProvider(
+        resource=Resource.create({SERVICE_NAME: settings.otel_service_name})
+    )
+    provider.add_span_processor(
+        BatchSpanProcessor(
+            OTLPSpanExporter(endpoint=settings.otel_exporter_otlp_endpoint),
+            max_queue_size=2048,
+            schedule_delay_millis=5000,
+        )
+    )
+    trace.set_tracer_provider(provider)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan manager."""
@@ -46,15 +78,30 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     # Initialize database
     await init_db()
     
+    # Probe the database in the background so /health/db never hits the pool
+    start_db_heartbeat()
+    
+    # Initialize RBAC enforcer once per process
+    if settings.enable_auth:
+        await rbac_manager.initialize()
+    
+    # Load search models and ensure the index exists before serving traffic;
+    # if OpenSearch is unavailable, serve everything else and let search
+    # retry its initialization on first use
+    try:
+        await search_service.initialize()
+    except Exception:
+        logger.warning("Search unavailable at startup, continuing without it")
+    
     yield
     
+    await search_service.close()
+    await stop_db_heartbeat()
     logger.info("Shutting down AI Venture Architect API")
 
 
 def create_app() -> FastAPI:
     """Create and configure FastAPI application."""
-    settings = get_settings()
-    
     app = FastAPI(
         title="AI Venture Architect API",
         description="Multi-agent market research & AI product ideation platform",
@@ -63,6 +110,7 @@ def create_app() -> FastAPI:
         docs_url="/v1/docs" if settings.environment != "production" else None,
         redoc_url="/v1/redoc" if settings.environment != "production" else None,
         lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
     
     # CORS middleware
@@ -70,14 +118,15 @@ def create_app() -> FastAPI:
         CORSMiddleware,
         allow_origins=settings.allowed_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=["GET", "POST", "PUT", "PATCH", "DELETE", "OPTIONS"],
+        allow_headers=["Authorization", "Content-Type", "X-Request-ID"],
+        max_age=600,
     )
     
     # Exception handler
     @app.exception_handler(APIException)
-    async def api_exception_handler(request: Request, exc: APIException) -> JSONResponse:
-        return JSONResponse(
+    async def api_exception_handler(request: Request, exc: APIException) -> ORJSONResponse:
+        return ORJSONResponse(
             status_code=exc.status_code,
             content={
                 "type": exc.error_type,
@@ -87,26 +136,12 @@ def create_app() -> FastAPI:
             },
         )
     
-    # Request logging middleware
-    @app.middleware("http")
-    async def log_requests(request: Request, call_next):
-        start_time = time.time()
-        response = await call_next(request)
-        process_time = time.time() - start_time
-        
-        logger.info(
-            "Request processed",
-            method=request.method,
-            url=str(request.url),
-            status_code=response.status_code,
-            process_time=process_time,
-        )
-        return response
+    # Request metrics and logging middleware
+    app.add_middleware(MonitoringMiddleware)
     
-    # Metrics endpoint
-    @app.get("/metrics")
-    async def metrics():
-        return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
+    # Metrics endpoint, served by prometheus_client's own ASGI app
+    if settings.enable_metrics:
+        app.mount("/metrics", make_asgi_app())
     
     # Include routers
     app.include_router(health.router, prefix="/v1")
@@ -117,7 +152,9 @@ def create_app() -> FastAPI:
     app.include_router(search.router, prefix="/v1", tags=["search"])
     
     # OpenTelemetry instrumentation
-    FastAPIInstrumentor.instrument_app(app)
+    if settings.enable_tracing:
+        configure_tracing()
+        FastAPIInstrumentor.instrument_app(app, excluded_urls="health,metrics")
     
     return app
 
@@ -125,14 +162,19 @@ def create_app() -> FastAPI:
 app = create_app()
 
 if __name__ == "__main__":
+    import os
+    
     import uvicorn
-    import time
     
-    settings = get_settings()
+    reload = settings.environment == "development"
     uvicorn.run(
         "main:app",
         host="0.0.0.0",
         port=8000,
-        reload=settings.environment == "development",
+        loop="uvloop",
+        http="httptools",
+        # Reload mode only supports a single worker
+        workers=1 if reload else int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1)),
+        reload=reload,
         log_config=None,  # Use structlog instead
     )
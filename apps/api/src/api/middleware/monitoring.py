@@ -1,23 +1,58 @@
 """Monitoring middleware for request tracking and performance measurement."""
 
+import re
 import time
+from functools import lru_cache
 from typing import Callable
+
+import structlog
 from fastapi import Request, Response
 from starlette.middleware.base import BaseHTTPMiddleware
 
+from api.core.config import settings
 from api.services.monitoring_service import monitoring_service
 
+logger = structlog.get_logger()
+
+_UUID_RE = re.compile(
+    r'/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
+    re.IGNORECASE
+)
+_NUMID_RE = re.compile(r'/\d+')
+_VER_RE = re.compile(r'/v\d+/')
+
+# Scrape and probe traffic is not recorded so it doesn't skew request metrics
+_UNTRACKED_PATHS = frozenset({"/metrics", "/metrics/", "/v1/health", "/v1/health/db"})
+
+
+@lru_cache(maxsize=2048)
+def _normalize_path(path: str) -> str:
+    """Collapse IDs and API versions in a path into placeholders."""
+    # Replace UUIDs
+    path = _UUID_RE.sub('/{id}', path)
+    
+    # Replace numeric IDs
+    path = _NUMID_RE.sub('/{id}', path)
+    
+    # Group API versions
+    path = _VER_RE.sub('/v{version}/', path)
+    
+    return path
+
 
 class MonitoringMiddleware(BaseHTTPMiddleware):
-    """Middleware to track request metrics and performance."""
+    """Middleware to track request metrics, performance and request logs."""
     
     async def dispatch(self, request: Request, call_next: Callable) -> Response:
         """Process request and track metrics."""
-        start_time = time.time()
+        path = request.url.path
+        if path in _UNTRACKED_PATHS:
+            return await call_next(request)
+        
+        start_ns = time.perf_counter_ns()
         
         # Extract request info
         method = request.method
-        path = request.url.path
         
         # Normalize endpoint for metrics (remove IDs, etc.)
         normalized_endpoint = self._normalize_endpoint(path)
@@ -25,27 +60,9 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
         try:
             # Process request
             response = await call_next(request)
-            
-            # Calculate duration
-            duration = time.time() - start_time
-            
-            # Record metrics
-            monitoring_service.record_request(
-                method=method,
-                endpoint=normalized_endpoint,
-                duration=duration,
-                status_code=response.status_code
-            )
-            
-            # Add performance headers
-            response.headers["X-Response-Time"] = f"{duration:.3f}s"
-            response.headers["X-Request-ID"] = request.headers.get("X-Request-ID", "unknown")
-            
-            return response
-            
-        except Exception as e:
+        except Exception:
             # Record error
-            duration = time.time() - start_time
+            duration = (time.perf_counter_ns() - start_ns) / 1e9
             monitoring_service.record_request(
                 method=method,
                 endpoint=normalized_endpoint,
@@ -53,27 +70,36 @@ class MonitoringMiddleware(BaseHTTPMiddleware):
                 status_code=500
             )
             raise
-    
-    def _normalize_endpoint(self, path: str) -> str:
-        """Normalize endpoint path for metrics grouping."""
-        # Remove UUIDs and numeric IDs
-        import re
         
-        # Replace UUIDs
-        path = re.sub(
-            r'/[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}',
-            '/{id}',
-            path,
-            flags=re.IGNORECASE
+        # Calculate duration
+        duration = (time.perf_counter_ns() - start_ns) / 1e9
+        
+        # Record metrics
+        monitoring_service.record_request(
+            method=method,
+            endpoint=normalized_endpoint,
+            duration=duration,
+            status_code=response.status_code
         )
         
-        # Replace numeric IDs
-        path = re.sub(r'/\d+', '/{id}', path)
+        logger.info(
+            "Request processed",
+            method=method,
+            path=path,
+            status_code=response.status_code,
+            process_time=duration,
+        )
         
-        # Group API versions
-        path = re.sub(r'/v\d+/', '/v{version}/', path)
+        # Add performance headers
+        if settings.debug:
+            response.headers["X-Response-Time"] = f"{duration:.3f}s"
+        response.headers["X-Request-ID"] = request.headers.get("X-Request-ID", "unknown")
         
-        return path
+        return response
+    
+    def _normalize_endpoint(self, path: str) -> str:
+        """Normalize endpoint path for metrics grouping."""
+        return _normalize_path(path)
 
 
 class SearchMonitoringMixin:
@@ -81,7 +107,7 @@ class SearchMonitoringMixin:
     
     async def monitor_search_request(self, search_type: str, func: Callable, *args, **kwargs):
         """Monitor search request performance."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         success = False
         
         try:
@@ -91,7 +117,7 @@ class SearchMonitoringMixin:
         except Exception as e:
             raise
         finally:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             monitoring_service.record_search_request(search_type, duration, success)
 
 
@@ -100,7 +126,7 @@ class IdeationMonitoringMixin:
     
     async def monitor_ideation_request(self, method: str, func: Callable, *args, **kwargs):
         """Monitor ideation request performance."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         success = False
         
         try:
@@ -110,7 +136,7 @@ class IdeationMonitoringMixin:
         except Exception as e:
             raise
         finally:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             monitoring_service.record_idea_generation(method, duration, success)
 
 
@@ -119,7 +145,7 @@ class ExportMonitoringMixin:
     
     async def monitor_export_request(self, export_type: str, func: Callable, *args, **kwargs):
         """Monitor export request performance."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         success = False
         
         try:
@@ -129,5 +155,5 @@ class ExportMonitoringMixin:
         except Exception as e:
             raise
         finally:
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             monitoring_service.record_export_request(export_type, duration, success)
@@ -3,17 +3,21 @@
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, List, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from api.core.database import Base
+from api.core.database import Base, string_enum, uuid7
 
 if TYPE_CHECKING:
     from api.models.workspace import Workspace
 
+# Empty JSONB defaults are supplied by Postgres on INSERT
+_EMPTY_OBJECT = text("'{}'::jsonb")
+_EMPTY_ARRAY = text("'[]'::jsonb")
+
 
 class IdeaStatus(str, Enum):
     """Idea processing status."""
@@ -29,11 +33,23 @@ class Idea(Base):
     """Idea model for generated product concepts."""
     
     __tablename__ = "ideas"
+    __table_args__ = (
+        Index(
+            "ix_ideas_ws_status_created_at",
+            "workspace_id",
+            "status",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index("ix_ideas_ws_created_at", "workspace_id", text("created_at DESC"), text("id DESC")),
+    )
+    # Fetch server-generated defaults back in the INSERT's RETURNING clause
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
     workspace_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -51,44 +67,44 @@ class Idea(Base):
     solution_approach: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Target market
-    icps: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)  # Ideal Customer Profiles
-    target_segments: Mapped[List[str]] = mapped_column(JSONB, default=list)
+    icps: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=_EMPTY_OBJECT, nullable=False)  # Ideal Customer Profiles
+    target_segments: Mapped[List[str]] = mapped_column(JSONB, server_default=_EMPTY_ARRAY, nullable=False)
     
     # Product details
-    mvp_features: Mapped[List[str]] = mapped_column(JSONB, default=list)
-    roadmap: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
+    mvp_features: Mapped[List[str]] = mapped_column(JSONB, server_default=_EMPTY_ARRAY, nullable=False)
+    roadmap: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=_EMPTY_OBJECT, nullable=False)
     positioning: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Business model
-    tam_sam_som: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
-    unit_economics: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
+    tam_sam_som: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=_EMPTY_OBJECT, nullable=False)
+    unit_economics: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=_EMPTY_OBJECT, nullable=False)
     pricing_model: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
     # Technical feasibility
-    tech_stack: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
-    build_vs_buy: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
-    technical_risks: Mapped[List[str]] = mapped_column(JSONB, default=list)
+    tech_stack: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=_EMPTY_OBJECT, nullable=False)
+    build_vs_buy: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=_EMPTY_OBJECT, nullable=False)
+    technical_risks: Mapped[List[str]] = mapped_column(JSONB, server_default=_EMPTY_ARRAY, nullable=False)
     
     # GTM strategy
-    gtm_strategy: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
-    channels: Mapped[List[str]] = mapped_column(JSONB, default=list)
+    gtm_strategy: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=_EMPTY_OBJECT, nullable=False)
+    channels: Mapped[List[str]] = mapped_column(JSONB, server_default=_EMPTY_ARRAY, nullable=False)
     
     # Risk assessment
-    risks: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
-    compliance_notes: Mapped[List[str]] = mapped_column(JSONB, default=list)
+    risks: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=_EMPTY_OBJECT, nullable=False)
+    compliance_notes: Mapped[List[str]] = mapped_column(JSONB, server_default=_EMPTY_ARRAY, nullable=False)
     
     # Scoring
     attractiveness_score: Mapped[Optional[float]] = mapped_column(nullable=True)
     confidence_score: Mapped[Optional[float]] = mapped_column(nullable=True)
-    score_breakdown: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
+    score_breakdown: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=_EMPTY_OBJECT, nullable=False)
     
     # Sources and citations
-    sources: Mapped[List[str]] = mapped_column(JSONB, default=list)
-    citations: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
+    sources: Mapped[List[str]] = mapped_column(JSONB, server_default=_EMPTY_ARRAY, nullable=False)
+    citations: Mapped[Dict[str, Any]] = mapped_column(JSONB, server_default=_EMPTY_OBJECT, nullable=False)
     
     # Processing
     status: Mapped[IdeaStatus] = mapped_column(
-        SQLEnum(IdeaStatus),
+        string_enum(IdeaStatus),
         nullable=False,
         default=IdeaStatus.DRAFT,
     )
@@ -110,7 +126,7 @@ class Idea(Base):
     )
     
     # Relationships
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="ideas")
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="ideas", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<Idea(id={self.id}, title='{self.title}', status={self.status})>"
@@ -3,13 +3,13 @@
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, Any, Dict, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import DateTime, Enum as SQLEnum, ForeignKey, String, Text, func
+from sqlalchemy import DateTime, ForeignKey, Index, String, Text, func
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from api.core.database import Base
+from api.core.database import Base, string_enum, uuid7
 
 if TYPE_CHECKING:
     from api.models.workspace import Workspace
@@ -48,11 +48,14 @@ class Report(Base):
     """Report model for exports and generated documents."""
     
     __tablename__ = "reports"
+    __table_args__ = (
+        Index("ix_reports_ws_type_status", "workspace_id", "report_type", "status"),
+    )
     
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
     workspace_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -64,11 +67,11 @@ class Report(Base):
     title: Mapped[str] = mapped_column(String(500), nullable=False)
     description: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     report_type: Mapped[ReportType] = mapped_column(
-        SQLEnum(ReportType),
+        string_enum(ReportType),
         nullable=False,
     )
     format: Mapped[ReportFormat] = mapped_column(
-        SQLEnum(ReportFormat),
+        string_enum(ReportFormat),
         nullable=False,
     )
     
@@ -87,7 +90,7 @@ class Report(Base):
     
     # Processing
     status: Mapped[ReportStatus] = mapped_column(
-        SQLEnum(ReportStatus),
+        string_enum(ReportStatus),
         nullable=False,
         default=ReportStatus.PENDING,
     )
@@ -109,7 +112,7 @@ class Report(Base):
     )
     
     # Relationships
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="reports")
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="reports", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<Report(id={self.id}, title='{self.title}', type={self.report_type}, status={self.status})>"
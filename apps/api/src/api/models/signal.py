@@ -1,33 +1,81 @@
 """Signal model for market data ingestion."""
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, Dict, Optional
-from uuid import UUID, uuid4
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
+from uuid import UUID
 
-from sqlalchemy import DateTime, ForeignKey, String, Text, func
+from pgvector.sqlalchemy import Vector
+from sqlalchemy import DDL, DateTime, Float, ForeignKey, Index, String, Text, event, func, text
 from sqlalchemy.dialects.postgresql import JSONB, UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from api.core.database import Base
+from api.core.database import Base, uuid7
 
 if TYPE_CHECKING:
     from api.models.workspace import Workspace
 
+# JSON object stored in JSONB columns
+JSONDict = Dict[str, Any]
+
+# Output dimension of the all-MiniLM-L6-v2 sentence embedding model
+EMBEDDING_DIM = 384
+
+# Number of hash partitions the signals table is split into by workspace
+SIGNAL_PARTITIONS = 8
+
 
 class Signal(Base):
     """Signal model for ingested market data."""
     
     __tablename__ = "signals"
+    __table_args__ = (
+        # Workspace-scoped listing, newest first, with or without a source filter
+        Index(
+            "ix_signals_ws_source_created_at",
+            "workspace_id",
+            "source",
+            text("created_at DESC"),
+            text("id DESC"),
+            postgresql_include=["title", "url", "published_at"],
+        ),
+        Index("ix_signals_ws_created_at", "workspace_id", text("created_at DESC"), text("id DESC")),
+        # Dedupe key for connector re-ingestion
+        Index(
+            "ix_signals_ws_source_source_id",
+            "workspace_id",
+            "source",
+            "source_id",
+            unique=True,
+            postgresql_where=text("source_id IS NOT NULL"),
+        ),
+        # Residual key/containment lookups on the remaining metadata
+        Index(
+            "ix_signals_metadata_gin",
+            "meta",
+            postgresql_using="gin",
+            postgresql_ops={"meta": "jsonb_path_ops"},
+        ),
+        Index(
+            "ix_signals_embedding_hnsw",
+            "embedding",
+            postgresql_using="hnsw",
+            postgresql_with={"m": 16, "ef_construction": 64},
+            postgresql_ops={"embedding": "vector_cosine_ops"},
+        ),
+        # Every query is workspace-scoped, so the planner prunes to one partition
+        {"postgresql_partition_by": "HASH (workspace_id)"},
+    )
     
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
+    # Part of the primary key because unique constraints must include the partition key
     workspace_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         ForeignKey("workspaces.id", ondelete="CASCADE"),
-        nullable=False,
+        primary_key=True,
     )
     
     # Source information
@@ -40,14 +88,19 @@ class Signal(Base):
     content: Mapped[str] = mapped_column(Text, nullable=False)
     summary: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
-    # Metadata
-    metadata: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
+    # Metadata (frequently filtered keys are promoted to the typed columns below).
+    # Mapped as ``meta`` because ``metadata`` is reserved on declarative classes;
+    # the database column keeps its original name.
+    meta: Mapped[JSONDict] = mapped_column("metadata", JSONB, default=dict, key="meta")
+    source_score: Mapped[Optional[float]] = mapped_column(Float, nullable=True, index=True)
+    language: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True)
+    author: Mapped[Optional[str]] = mapped_column(String(255), nullable=True)
     
     # Entity information (extracted)
-    entities: Mapped[Dict[str, Any]] = mapped_column(JSONB, default=dict)
+    entities: Mapped[JSONDict] = mapped_column(JSONB, default=dict)
     
-    # Embeddings (stored as array in JSONB for now, will move to pgvector)
-    embedding: Mapped[Optional[Dict[str, Any]]] = mapped_column(JSONB, nullable=True)
+    # Embeddings (pgvector, indexed with HNSW for cosine distance)
+    embedding: Mapped[Optional[List[float]]] = mapped_column(Vector(EMBEDDING_DIM), nullable=True)
     
     # Processing status
     processed_at: Mapped[Optional[datetime]] = mapped_column(
@@ -73,7 +126,18 @@ class Signal(Base):
     )
     
     # Relationships
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="signals")
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="signals", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<Signal(id={self.id}, source='{self.source}', workspace_id={self.workspace_id})>"
+
+
+for _remainder in range(SIGNAL_PARTITIONS):
+    event.listen(
+        Signal.__table__,
+        "after_create",
+        DDL(
+            f"CREATE TABLE IF NOT EXISTS signals_p{_remainder} PARTITION OF signals "
+            f"FOR VALUES WITH (MODULUS {SIGNAL_PARTITIONS}, REMAINDER {_remainder})"
+        ),
+    )
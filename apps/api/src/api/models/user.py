@@ -3,13 +3,13 @@
 from datetime import datetime
 from enum import Enum
 from typing import TYPE_CHECKING, List, Optional
-from uuid import UUID, uuid4
+from uuid import UUID
 
-from sqlalchemy import Boolean, DateTime, Enum as SQLEnum, ForeignKey, String, func
+from sqlalchemy import Boolean, DateTime, ForeignKey, Index, String, func, text
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from api.core.database import Base
+from api.core.database import Base, string_enum, uuid7
 
 if TYPE_CHECKING:
     from api.models.workspace import Workspace
@@ -28,11 +28,21 @@ class User(Base):
     """User model."""
     
     __tablename__ = "users"
+    __table_args__ = (
+        # OAuth login lookup; password-only accounts are left out of the index
+        Index(
+            "ix_users_oauth_provider_oauth_id",
+            "oauth_provider",
+            "oauth_id",
+            unique=True,
+            postgresql_where=text("oauth_id IS NOT NULL"),
+        ),
+    )
     
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
     email: Mapped[str] = mapped_column(String(255), unique=True, nullable=False)
     full_name: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -64,6 +74,8 @@ class User(Base):
         "UserWorkspace",
         back_populates="user",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     
     def __repr__(self) -> str:
@@ -78,7 +90,7 @@ class UserWorkspace(Base):
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
     user_id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
@@ -91,7 +103,7 @@ class UserWorkspace(Base):
         nullable=False,
     )
     role: Mapped[UserRole] = mapped_column(
-        SQLEnum(UserRole),
+        string_enum(UserRole),
         nullable=False,
         default=UserRole.MEMBER,
     )
@@ -108,8 +120,8 @@ class UserWorkspace(Base):
     )
     
     # Relationships
-    user: Mapped["User"] = relationship("User", back_populates="user_workspaces")
-    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="user_workspaces")
+    user: Mapped["User"] = relationship("User", back_populates="user_workspaces", lazy="raise")
+    workspace: Mapped["Workspace"] = relationship("Workspace", back_populates="user_workspaces", lazy="raise")
     
     def __repr__(self) -> str:
         return f"<UserWorkspace(user_id={self.user_id}, workspace_id={self.workspace_id}, role={self.role})>"
@@ -2,13 +2,13 @@
 
 from datetime import datetime
 from typing import TYPE_CHECKING, List
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from sqlalchemy import DateTime, String, Text, func
 from sqlalchemy.dialects.postgresql import UUID as PG_UUID
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from api.core.database import Base
+from api.core.database import Base, uuid7
 
 if TYPE_CHECKING:
     from api.models.user import UserWorkspace
@@ -25,7 +25,7 @@ class Workspace(Base):
     id: Mapped[UUID] = mapped_column(
         PG_UUID(as_uuid=True),
         primary_key=True,
-        default=uuid4,
+        default=uuid7,
     )
     name: Mapped[str] = mapped_column(String(255), nullable=False)
     slug: Mapped[str] = mapped_column(String(100), unique=True, nullable=False)
@@ -42,26 +42,35 @@ class Workspace(Base):
         onupdate=func.now(),
     )
     
-    # Relationships
+    # Relationships (lazy="raise": callers must opt in with selectinload()
+    # rather than triggering implicit IO, which fails under asyncio)
     user_workspaces: Mapped[List["UserWorkspace"]] = relationship(
         "UserWorkspace",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     signals: Mapped[List["Signal"]] = relationship(
         "Signal",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     ideas: Mapped[List["Idea"]] = relationship(
         "Idea",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     reports: Mapped[List["Report"]] = relationship(
         "Report",
         back_populates="workspace",
         cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="raise",
     )
     
     def __repr__(self) -> str:
@@ -1,16 +1,31 @@
 """Export and report generation endpoints."""
 
+import os
+from datetime import datetime, timezone
 from typing import List
 from uuid import UUID
 
 from fastapi import APIRouter, Depends
+from fastapi.responses import FileResponse, RedirectResponse
 from pydantic import BaseModel
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.core.auth import AuthWorkspace, get_current_workspace
 from api.core.database import get_db
+from api.core.exceptions import ConflictError, NotFoundError
+from api.models.report import Report, ReportFormat, ReportStatus
 
 router = APIRouter()
 
+_MEDIA_TYPES = {
+    ReportFormat.PDF: "application/pdf",
+    ReportFormat.HTML: "text/html",
+    ReportFormat.JSON: "application/json",
+    ReportFormat.CSV: "text/csv",
+    ReportFormat.NOTION: "text/markdown",
+}
+
 
 class ExportRequest(BaseModel):
     """Export request model."""
@@ -66,8 +81,40 @@ async def get_export_status(
 @router.get("/{report_id}/download")
 async def download_report(
     report_id: UUID,
+    user_workspace: AuthWorkspace = Depends(get_current_workspace),
     db: AsyncSession = Depends(get_db),
 ):
     """Download generated report."""
-    # TODO: Implement report download logic
-    raise NotImplementedError("Report download not yet implemented")
+    result = await db.execute(
+        select(
+            Report.status,
+            Report.format,
+            Report.file_path,
+            Report.signed_url,
+            Report.signed_url_expires_at,
+        ).where(
+            Report.id == report_id,
+            Report.workspace_id == user_workspace.workspace_id,
+        )
+    )
+    report = result.one_or_none()
+    if report is None:
+        raise NotFoundError("Report", str(report_id))
+    if report.status != ReportStatus.COMPLETED:
+        raise ConflictError(f"Report is not ready for download (status: {report.status.value})")
+    
+    # Hand off to object storage while the presigned URL is still valid
+    if report.signed_url and report.signed_url_expires_at and (
+        report.signed_url_expires_at > datetime.now(timezone.utc)
+    ):
+        return RedirectResponse(report.signed_url, status_code=307)
+    
+    if not report.file_path or not os.path.isfile(report.file_path):
+        raise NotFoundError("Report file", str(report_id))
+    
+    # FileResponse streams from disk (sendfile where available) instead of buffering
+    return FileResponse(
+        report.file_path,
+        media_type=_MEDIA_TYPES.get(report.format, "application/octet-stream"),
+        filename=os.path.basename(report.file_path),
+    )
@@ -1,9 +1,8 @@
 """Health check endpoints."""
 
-from fastapi import APIRouter, Depends
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import APIRouter
 
-from api.core.database import get_db
+from api.core.database import get_db_state
 
 router = APIRouter()
 
@@ -15,10 +14,6 @@ async def health_check():
 
 
 @router.get("/health/db")
-async def health_check_db(db: AsyncSession = Depends(get_db)):
-    """Database health check."""
-    try:
-        await db.execute("SELECT 1")
-        return {"status": "healthy", "database": "connected"}
-    except Exception as e:
-        return {"status": "unhealthy", "database": "disconnected", "error": str(e)}
+async def health_check_db():
+    """Database health check served from the cached heartbeat state."""
+    return get_db_state()
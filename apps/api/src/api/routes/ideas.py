@@ -1,38 +1,62 @@
 """Idea management endpoints."""
 
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.core.auth import AuthWorkspace, get_current_workspace
 from api.core.database import get_db
+from api.core.exceptions import ValidationError
+from api.core.pagination import keyset_condition, next_cursor
+from api.models.idea import Idea, IdeaStatus
 
 router = APIRouter()
 
+# Columns rendered in idea listings
+_IDEA_LIST_COLS = (
+    Idea.id,
+    Idea.workspace_id,
+    Idea.title,
+    Idea.description,
+    Idea.uvp,
+    Idea.status,
+    Idea.attractiveness_score,
+    Idea.confidence_score,
+    Idea.created_at,
+)
+
 
 class IdeaResponse(BaseModel):
     """Idea response model."""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: UUID
     workspace_id: UUID
     title: str
     description: str
     uvp: Optional[str]
-    status: str
+    status: IdeaStatus
     attractiveness_score: Optional[float]
     confidence_score: Optional[float]
-    created_at: str
+    created_at: datetime
 
 
 class IdeaListResponse(BaseModel):
     """Idea list response model."""
     ideas: List[IdeaResponse]
-    total: int
-    page: int
+    next_cursor: Optional[str]
     per_page: int
 
 
+# Validates whole result pages straight from row attributes
+_IDEA_LIST_ADAPTER = TypeAdapter(List[IdeaResponse])
+
+
 class GenerateIdeaRequest(BaseModel):
     """Generate idea request model."""
     query: str
@@ -49,17 +73,35 @@ class GenerateIdeaResponse(BaseModel):
 
 @router.get("", response_model=IdeaListResponse)
 async def list_ideas(
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None),
     per_page: int = Query(20, ge=1, le=100),
     status: Optional[str] = Query(None),
+    user_workspace: AuthWorkspace = Depends(get_current_workspace),
     db: AsyncSession = Depends(get_db),
 ):
     """List ideas with pagination and filtering."""
-    # TODO: Implement idea listing logic
+    conditions = [Idea.workspace_id == user_workspace.workspace_id]
+    if status:
+        try:
+            conditions.append(Idea.status == IdeaStatus(status))
+        except ValueError:
+            raise ValidationError(f"Unknown idea status: {status}")
+    after_cursor = keyset_condition(Idea.created_at, Idea.id, cursor)
+    if after_cursor is not None:
+        conditions.append(after_cursor)
+    
+    # Keyset seek on ix_ideas_ws_(status_)created_at; one extra row detects a next page
+    result = await db.execute(
+        select(*_IDEA_LIST_COLS)
+        .where(*conditions)
+        .order_by(Idea.created_at.desc(), Idea.id.desc())
+        .limit(per_page + 1)
+    )
+    rows = result.all()
+    
     return IdeaListResponse(
-        ideas=[],
-        total=0,
-        page=page,
+        ideas=_IDEA_LIST_ADAPTER.validate_python(rows[:per_page], from_attributes=True),
+        next_cursor=next_cursor(rows, per_page),
         per_page=per_page,
     )
 
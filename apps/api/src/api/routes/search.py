@@ -1,19 +1,146 @@
 """Search endpoints for hybrid search functionality."""
 
-from typing import Any, Dict, List, Optional
+import time
+from typing import Any, Dict, List, Optional, Tuple
 from uuid import UUID
 
+import msgspec
 from fastapi import APIRouter, Depends, Query
 from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from api.core.database import get_db
-from api.core.auth import get_current_workspace
+from api.core.auth import AuthWorkspace, get_current_workspace
+from api.core.responses import MsgspecResponse
 from api.services.search import search_service
-from api.models.user import UserWorkspace
 
 router = APIRouter()
 
+# Suggestion corpus
+_SUGGESTION_INDUSTRIES = (
+    "ai and machine learning", "fintech", "healthcare", "ecommerce",
+    "gaming", "education", "productivity", "security", "iot"
+)
+_SUGGESTION_TECHNOLOGIES = (
+    "artificial intelligence", "blockchain", "cloud computing",
+    "mobile apps", "web development", "data analytics"
+)
+
+# Static filter options
+_SEARCH_FILTERS = {
+    "sources": [
+        {"value": "product_hunt", "label": "Product Hunt", "count": 150},
+        {"value": "github", "label": "GitHub", "count": 200},
+        {"value": "rss", "label": "RSS/News", "count": 300},
+        {"value": "crunchbase", "label": "Crunchbase", "count": 50},
+        {"value": "google_trends", "label": "Google Trends", "count": 100}
+    ],
+    "industries": [
+        {"value": "software", "label": "Software", "count": 180},
+        {"value": "ai_ml", "label": "AI/ML", "count": 120},
+        {"value": "fintech", "label": "FinTech", "count": 90},
+        {"value": "healthcare", "label": "Healthcare", "count": 70},
+        {"value": "ecommerce", "label": "E-commerce", "count": 85},
+        {"value": "gaming", "label": "Gaming", "count": 45},
+        {"value": "education", "label": "Education", "count": 60},
+        {"value": "productivity", "label": "Productivity", "count": 95},
+        {"value": "security", "label": "Security", "count": 55},
+        {"value": "iot", "label": "IoT", "count": 40}
+    ],
+    "technologies": [
+        {"value": "python", "label": "Python", "count": 80},
+        {"value": "javascript", "label": "JavaScript", "count": 90},
+        {"value": "react", "label": "React", "count": 70},
+        {"value": "nodejs", "label": "Node.js", "count": 60},
+        {"value": "aws", "label": "AWS", "count": 50},
+        {"value": "docker", "label": "Docker", "count": 45},
+        {"value": "kubernetes", "label": "Kubernetes", "count": 30}
+    ]
+}
+
+# Analytics rollup served by /search/analytics (mock until search logs are recorded)
+_SEARCH_ANALYTICS = {
+    "total_searches": 1250,
+    "avg_results_per_search": 15.3,
+    "avg_search_time_ms": 450,
+    "top_queries": [
+        {"query": "ai startups", "count": 45},
+        {"query": "fintech trends", "count": 38},
+        {"query": "saas opportunities", "count": 32},
+        {"query": "mobile apps", "count": 28},
+        {"query": "healthcare innovation", "count": 25}
+    ],
+    "top_sources": [
+        {"source": "rss", "percentage": 35},
+        {"source": "github", "percentage": 25},
+        {"source": "product_hunt", "percentage": 20},
+        {"source": "crunchbase", "percentage": 15},
+        {"source": "google_trends", "percentage": 5}
+    ],
+    "search_performance": {
+        "hybrid_score": 0.85,
+        "bm25_contribution": 0.4,
+        "vector_contribution": 0.4,
+        "rerank_contribution": 0.2
+    }
+}
+
+
+def _normalize_query(q: str) -> str:
+    """Lowercase a query and collapse whitespace so equivalent queries share a cache entry."""
+    return " ".join(q.lower().split())
+
+
+def _build_suggestions(q: str) -> Tuple[Dict[str, str], ...]:
+    """Build suggestions for a normalized query."""
+    suggestions = []
+    
+    # Industry-based suggestions
+    for industry in _SUGGESTION_INDUSTRIES:
+        if q in industry:
+            suggestions.append({
+                "text": f"{industry} trends",
+                "type": "trend",
+                "category": "industry"
+            })
+            suggestions.append({
+                "text": f"{industry} startups",
+                "type": "search",
+                "category": "industry"
+            })
+    
+    # Technology-based suggestions
+    for tech in _SUGGESTION_TECHNOLOGIES:
+        if q in tech:
+            suggestions.append({
+                "text": f"{tech} opportunities",
+                "type": "whitespace",
+                "category": "technology"
+            })
+    
+    return tuple(suggestions[:10])
+
+
+def _build_suggestion_index() -> Dict[str, Tuple[Dict[str, str], ...]]:
+    """Map every non-empty substring of the corpus to its suggestions."""
+    substrings = {
+        term[i:j]
+        for term in _SUGGESTION_INDUSTRIES + _SUGGESTION_TECHNOLOGIES
+        for i in range(len(term))
+        for j in range(i + 1, len(term) + 1)
+    }
+    return {sub: _build_suggestions(sub) for sub in substrings}
+
+
+# Any query that is not a substring of some corpus term has no suggestions,
+# so a single dict lookup answers every request; a blank query misses too
+_SUGGESTION_INDEX = _build_suggestion_index()
+
+
+def _suggest(q: str) -> Tuple[Dict[str, str], ...]:
+    """Look up suggestions for a normalized query."""
+    return _SUGGESTION_INDEX.get(q, ())
+
 
 class SearchRequest(BaseModel):
     """Search request model."""
@@ -23,8 +150,8 @@ class SearchRequest(BaseModel):
     hybrid_weights: Optional[Dict[str, float]] = None
 
 
-class SearchResponse(BaseModel):
-    """Search response model."""
+class SearchResponse(msgspec.Struct):
+    """Search response model, encoded straight to JSON without a validation pass."""
     results: List[Dict[str, Any]]
     total_results: int
     query: str
@@ -45,19 +172,14 @@ class WhitespaceSearchRequest(BaseModel):
     limit: int = Field(default=20, ge=1, le=50)
 
 
-@router.post("/search", response_model=SearchResponse)
+@router.post("/search", response_class=MsgspecResponse)
 async def hybrid_search(
     request: SearchRequest,
-    user_workspace: UserWorkspace = Depends(get_current_workspace),
+    user_workspace: AuthWorkspace = Depends(get_current_workspace),
     db: AsyncSession = Depends(get_db),
 ):
     """Perform hybrid search across market signals."""
-    import time
-    
-    start_time = time.time()
-    
-    # Initialize search service if needed
-    await search_service.initialize()
+    start_ns = time.perf_counter_ns()
     
     # Perform search
     results = await search_service.search(
@@ -68,29 +190,24 @@ async def hybrid_search(
         hybrid_weights=request.hybrid_weights
     )
     
-    search_time = (time.time() - start_time) * 1000
+    search_time = (time.perf_counter_ns() - start_ns) / 1e6
     
-    return SearchResponse(
+    return MsgspecResponse(SearchResponse(
         results=results,
         total_results=len(results),
         query=request.query,
         search_time_ms=search_time
-    )
+    ))
 
 
-@router.post("/search/trends", response_model=SearchResponse)
+@router.post("/search/trends", response_class=MsgspecResponse)
 async def search_trends(
     request: TrendSearchRequest,
-    user_workspace: UserWorkspace = Depends(get_current_workspace),
+    user_workspace: AuthWorkspace = Depends(get_current_workspace),
     db: AsyncSession = Depends(get_db),
 ):
     """Search for trending topics and patterns."""
-    import time
-    
-    start_time = time.time()
-    
-    # Initialize search service if needed
-    await search_service.initialize()
+    start_ns = time.perf_counter_ns()
     
     # Perform trend search
     results = await search_service.search_trends(
@@ -100,30 +217,25 @@ async def search_trends(
         limit=request.limit
     )
     
-    search_time = (time.time() - start_time) * 1000
+    search_time = (time.perf_counter_ns() - start_ns) / 1e6
     
-    return SearchResponse(
+    return MsgspecResponse(SearchResponse(
         results=results,
         total_results=len(results),
         query=request.query,
         search_time_ms=search_time,
         method="trend_analysis"
-    )
+    ))
 
 
-@router.post("/search/whitespace", response_model=SearchResponse)
+@router.post("/search/whitespace", response_class=MsgspecResponse)
 async def search_whitespace(
     request: WhitespaceSearchRequest,
-    user_workspace: UserWorkspace = Depends(get_current_workspace),
+    user_workspace: AuthWorkspace = Depends(get_current_workspace),
     db: AsyncSession = Depends(get_db),
 ):
     """Search for whitespace opportunities in a specific industry."""
-    import time
-    
-    start_time = time.time()
-    
-    # Initialize search service if needed
-    await search_service.initialize()
+    start_ns = time.perf_counter_ns()
     
     # Perform whitespace search
     results = await search_service.search_whitespace(
@@ -132,140 +244,46 @@ async def search_whitespace(
         limit=request.limit
     )
     
-    search_time = (time.time() - start_time) * 1000
+    search_time = (time.perf_counter_ns() - start_ns) / 1e6
     
-    return SearchResponse(
+    return MsgspecResponse(SearchResponse(
         results=results,
         total_results=len(results),
         query=f"whitespace in {request.industry}",
         search_time_ms=search_time,
         method="whitespace_analysis"
-    )
+    ))
 
 
 @router.get("/search/suggestions")
 async def get_search_suggestions(
     q: str = Query(..., min_length=1, max_length=100),
-    user_workspace: UserWorkspace = Depends(get_current_workspace),
-    db: AsyncSession = Depends(get_db),
+    user_workspace: AuthWorkspace = Depends(get_current_workspace),
 ):
     """Get search suggestions based on query prefix."""
     # This would typically use a suggestion service or autocomplete index
     # For now, return some basic suggestions
-    
-    suggestions = []
-    
-    # Industry-based suggestions
-    industries = [
-        "ai and machine learning", "fintech", "healthcare", "ecommerce",
-        "gaming", "education", "productivity", "security", "iot"
-    ]
-    
-    for industry in industries:
-        if q.lower() in industry.lower():
-            suggestions.append({
-                "text": f"{industry} trends",
-                "type": "trend",
-                "category": "industry"
-            })
-            suggestions.append({
-                "text": f"{industry} startups",
-                "type": "search",
-                "category": "industry"
-            })
-    
-    # Technology-based suggestions
-    technologies = [
-        "artificial intelligence", "blockchain", "cloud computing",
-        "mobile apps", "web development", "data analytics"
-    ]
-    
-    for tech in technologies:
-        if q.lower() in tech.lower():
-            suggestions.append({
-                "text": f"{tech} opportunities",
-                "type": "whitespace",
-                "category": "technology"
-            })
-    
     return {
-        "suggestions": suggestions[:10],
+        "suggestions": list(_suggest(_normalize_query(q))),
         "query": q
     }
 
 
 @router.get("/search/filters")
 async def get_search_filters(
-    user_workspace: UserWorkspace = Depends(get_current_workspace),
-    db: AsyncSession = Depends(get_db),
+    user_workspace: AuthWorkspace = Depends(get_current_workspace),
 ):
     """Get available search filters for the workspace."""
     # This would typically query the database for available filter values
     # For now, return static filter options
-    
-    return {
-        "sources": [
-            {"value": "product_hunt", "label": "Product Hunt", "count": 150},
-            {"value": "github", "label": "GitHub", "count": 200},
-            {"value": "rss", "label": "RSS/News", "count": 300},
-            {"value": "crunchbase", "label": "Crunchbase", "count": 50},
-            {"value": "google_trends", "label": "Google Trends", "count": 100}
-        ],
-        "industries": [
-            {"value": "software", "label": "Software", "count": 180},
-            {"value": "ai_ml", "label": "AI/ML", "count": 120},
-            {"value": "fintech", "label": "FinTech", "count": 90},
-            {"value": "healthcare", "label": "Healthcare", "count": 70},
-            {"value": "ecommerce", "label": "E-commerce", "count": 85},
-            {"value": "gaming", "label": "Gaming", "count": 45},
-            {"value": "education", "label": "Education", "count": 60},
-            {"value": "productivity", "label": "Productivity", "count": 95},
-            {"value": "security", "label": "Security", "count": 55},
-            {"value": "iot", "label": "IoT", "count": 40}
-        ],
-        "technologies": [
-            {"value": "python", "label": "Python", "count": 80},
-            {"value": "javascript", "label": "JavaScript", "count": 90},
-            {"value": "react", "label": "React", "count": 70},
-            {"value": "nodejs", "label": "Node.js", "count": 60},
-            {"value": "aws", "label": "AWS", "count": 50},
-            {"value": "docker", "label": "Docker", "count": 45},
-            {"value": "kubernetes", "label": "Kubernetes", "count": 30}
-        ]
-    }
+    return _SEARCH_FILTERS
 
 
 @router.get("/search/analytics")
 async def get_search_analytics(
-    user_workspace: UserWorkspace = Depends(get_current_workspace),
-    db: AsyncSession = Depends(get_db),
+    user_workspace: AuthWorkspace = Depends(get_current_workspace),
 ):
     """Get search analytics and insights."""
-    # This would typically query analytics data
+    # This would typically read a periodically refreshed rollup of search logs
     # For now, return mock analytics
-    
-    return {
-        "total_searches": 1250,
-        "avg_results_per_search": 15.3,
-        "avg_search_time_ms": 450,
-        "top_queries": [
-            {"query": "ai startups", "count": 45},
-            {"query": "fintech trends", "count": 38},
-            {"query": "saas opportunities", "count": 32},
-            {"query": "mobile apps", "count": 28},
-            {"query": "healthcare innovation", "count": 25}
-        ],
-        "top_sources": [
-            {"source": "rss", "percentage": 35},
-            {"source": "github", "percentage": 25},
-            {"source": "product_hunt", "percentage": 20},
-            {"source": "crunchbase", "percentage": 15},
-            {"source": "google_trends", "percentage": 5}
-        ],
-        "search_performance": {
-            "hybrid_score": 0.85,
-            "bm25_contribution": 0.4,
-            "vector_contribution": 0.4,
-            "rerank_contribution": 0.2
-        }
-    }
+    return _SEARCH_ANALYTICS
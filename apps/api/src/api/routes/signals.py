@@ -1,59 +1,110 @@
 """Signal management endpoints."""
 
+from datetime import datetime
 from typing import List, Optional
 from uuid import UUID
 
 from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
+from sqlalchemy import insert, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from api.core.auth import AuthWorkspace, get_current_workspace
 from api.core.database import get_db
+from api.core.exceptions import ValidationError
+from api.core.pagination import keyset_condition, next_cursor
+from api.models.signal import Signal
 
 router = APIRouter()
 
+# Rows per INSERT statement and upper bound on a single bulk request
+BULK_INSERT_BATCH_SIZE = 1000
+MAX_BULK_INGEST_SIZE = 10_000
+
+# Columns rendered in signal listings
+_SIGNAL_LIST_COLS = (
+    Signal.id,
+    Signal.workspace_id,
+    Signal.source,
+    Signal.title,
+    Signal.content,
+    Signal.url,
+    Signal.published_at,
+    Signal.created_at,
+)
+
 
 class SignalResponse(BaseModel):
     """Signal response model."""
+    model_config = ConfigDict(from_attributes=True)
+    
     id: UUID
     workspace_id: UUID
     source: str
     title: Optional[str]
     content: str
     url: Optional[str]
-    published_at: Optional[str]
-    created_at: str
+    published_at: Optional[datetime]
+    created_at: datetime
 
 
 class SignalListResponse(BaseModel):
     """Signal list response model."""
     signals: List[SignalResponse]
-    total: int
-    page: int
+    next_cursor: Optional[str]
     per_page: int
 
 
+# Validates whole result pages straight from row attributes
+_SIGNAL_LIST_ADAPTER = TypeAdapter(List[SignalResponse])
+
+
+class IngestMetadata(BaseModel):
+    """Free-form signal metadata; keys promoted to typed columns are validated."""
+    model_config = ConfigDict(extra="allow")
+    
+    source_score: Optional[float] = None
+    language: Optional[str] = Field(default=None, max_length=50)
+    author: Optional[str] = Field(default=None, max_length=255)
+
+
 class IngestRequest(BaseModel):
     """Signal ingestion request model."""
-    source: str
+    source: str = Field(..., max_length=100)
     url: Optional[str] = None
     content: str
-    title: Optional[str] = None
-    metadata: dict = {}
+    title: Optional[str] = Field(default=None, max_length=500)
+    metadata: IngestMetadata = IngestMetadata()
 
 
 @router.get("", response_model=SignalListResponse)
 async def list_signals(
-    page: int = Query(1, ge=1),
+    cursor: Optional[str] = Query(None),
     per_page: int = Query(20, ge=1, le=100),
     source: Optional[str] = Query(None),
+    user_workspace: AuthWorkspace = Depends(get_current_workspace),
     db: AsyncSession = Depends(get_db),
 ):
     """List signals with pagination and filtering."""
-    # TODO: Implement signal listing logic
+    conditions = [Signal.workspace_id == user_workspace.workspace_id]
+    if source:
+        conditions.append(Signal.source == source)
+    after_cursor = keyset_condition(Signal.created_at, Signal.id, cursor)
+    if after_cursor is not None:
+        conditions.append(after_cursor)
+    
+    # Keyset seek on ix_signals_ws_(source_)created_at; one extra row detects a next page
+    result = await db.execute(
+        select(*_SIGNAL_LIST_COLS)
+        .where(*conditions)
+        .order_by(Signal.created_at.desc(), Signal.id.desc())
+        .limit(per_page + 1)
+    )
+    rows = result.all()
+    
     return SignalListResponse(
-        signals=[],
-        total=0,
-        page=page,
+        signals=_SIGNAL_LIST_ADAPTER.validate_python(rows[:per_page], from_attributes=True),
+        next_cursor=next_cursor(rows, per_page),
         per_page=per_page,
     )
 
@@ -68,6 +119,41 @@ async def ingest_signal(
     return {"message": "Signal ingested successfully", "signal_id": "dummy_id"}
 
 
+@router.post("/ingest/bulk")
+async def ingest_signals_bulk(
+    requests: List[IngestRequest],
+    user_workspace: AuthWorkspace = Depends(get_current_workspace),
+    db: AsyncSession = Depends(get_db),
+):
+    """Ingest a batch of signals with multi-row inserts."""
+    if len(requests) > MAX_BULK_INGEST_SIZE:
+        raise ValidationError(
+            f"Bulk ingest accepts at most {MAX_BULK_INGEST_SIZE} signals per request"
+        )
+    
+    rows = [
+        {
+            "workspace_id": user_workspace.workspace_id,
+            "source": request.source,
+            "url": request.url,
+            "content": request.content,
+            "title": request.title,
+            "meta": request.metadata.model_dump(exclude_unset=True),
+            "source_score": request.metadata.source_score,
+            "language": request.metadata.language,
+            "author": request.metadata.author,
+        }
+        for request in requests
+    ]
+    
+    # Each batch is rendered by the engine into multi-row INSERT ... VALUES pages
+    for start in range(0, len(rows), BULK_INSERT_BATCH_SIZE):
+        await db.execute(insert(Signal), rows[start:start + BULK_INSERT_BATCH_SIZE])
+    await db.commit()
+    
+    return {"message": "Signals ingested successfully", "count": len(rows)}
+
+
 @router.get("/{signal_id}", response_model=SignalResponse)
 async def get_signal(
     signal_id: UUID,
@@ -1,17 +1,341 @@
 """Business modeling service for TAM/SAM/SOM, unit economics, and pricing analysis."""
 
-import math
-from typing import Any, Dict, List, Optional, Tuple
-from datetime import datetime
+import statistics
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from dataclasses import dataclass
 
 import structlog
 import numpy as np
 
+try:
+    from numba import njit
+except ImportError:  # numba is optional; fall back to plain NumPy
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit."""
+        if args and callable(args[0]):
+            return args[0]
+        return lambda func: func
+
 logger = structlog.get_logger()
 
+# Reference data below is read-only and built once at import time
+# (simplified - in production, use real data)
+
+# Industry benchmarks
+_INDUSTRY_BENCHMARKS = MappingProxyType({
+    "software": MappingProxyType({
+        "gross_margin": 0.80,
+        "cac_ltv_ratio": 3.0,
+        "payback_months": 12,
+        "churn_rate_monthly": 0.05,
+        "pricing_multiple": 10  # Annual revenue multiple for valuation
+    }),
+    "ai_ml": MappingProxyType({
+        "gross_margin": 0.75,
+        "cac_ltv_ratio": 4.0,
+        "payback_months": 18,
+        "churn_rate_monthly": 0.03,
+        "pricing_multiple": 15
+    }),
+    "fintech": MappingProxyType({
+        "gross_margin": 0.70,
+        "cac_ltv_ratio": 3.5,
+        "payback_months": 15,
+        "churn_rate_monthly": 0.04,
+        "pricing_multiple": 12
+    }),
+    "healthcare": MappingProxyType({
+        "gross_margin": 0.65,
+        "cac_ltv_ratio": 5.0,
+        "payback_months": 24,
+        "churn_rate_monthly": 0.02,
+        "pricing_multiple": 8
+    }),
+    "ecommerce": MappingProxyType({
+        "gross_margin": 0.40,
+        "cac_ltv_ratio": 2.5,
+        "payback_months": 8,
+        "churn_rate_monthly": 0.08,
+        "pricing_multiple": 6
+    })
+})
+
+# Market size data sources
+_MARKET_DATA_SOURCES = MappingProxyType({
+    "software": MappingProxyType({"global_market_2024": 650000, "growth_rate": 0.11}),
+    "ai_ml": MappingProxyType({"global_market_2024": 150000, "growth_rate": 0.35}),
+    "fintech": MappingProxyType({"global_market_2024": 310000, "growth_rate": 0.25}),
+    "healthcare": MappingProxyType({"global_market_2024": 350000, "growth_rate": 0.15}),
+    "ecommerce": MappingProxyType({"global_market_2024": 5800000, "growth_rate": 0.14})
+})
+
+# Share of the global market by geographic scope
+_GEO_MULTIPLIERS = MappingProxyType({
+    "global": 1.0,
+    "north_america": 0.35,
+    "europe": 0.25,
+    "asia_pacific": 0.30,
+    "us_only": 0.25,
+    "emerging_markets": 0.15
+})
+_GEO_MULTIPLIERS_GET = _GEO_MULTIPLIERS.get
+
+# Serviceable share of TAM by industry
+_SAM_BASE = MappingProxyType({
+    "software": 0.15,
+    "ai_ml": 0.08,
+    "fintech": 0.12,
+    "healthcare": 0.06,
+    "ecommerce": 0.20
+})
+_SAM_BASE_GET = _SAM_BASE.get
+
+# Obtainable share of SAM by industry
+_SOM_BASE = MappingProxyType({
+    "software": 0.05,
+    "ai_ml": 0.03,
+    "fintech": 0.04,
+    "healthcare": 0.02,
+    "ecommerce": 0.08
+})
+_SOM_BASE_GET = _SOM_BASE.get
+
+# Base customer counts by segment (simplified estimates)
+_BASE_CUSTOMERS = MappingProxyType({
+    "enterprise": 50000,
+    "smb": 500000,
+    "startups": 100000,
+    "consumers": 10000000,
+    "developers": 25000000,
+    "agencies": 75000
+})
+
+# Base ARPU by industry (annual)
+_BASE_ARPU = MappingProxyType({
+    "software": 2400,
+    "ai_ml": 12000,
+    "fintech": 1800,
+    "healthcare": 8000,
+    "ecommerce": 600
+})
+
+# ARPU adjustment by target segment
+_SEGMENT_MULTIPLIERS = MappingProxyType({
+    "enterprise": 3.0,
+    "smb": 1.0,
+    "startups": 0.3,
+    "consumers": 0.1,
+    "developers": 0.5,
+    "agencies": 1.5
+})
+
+# Base CAC by industry
+_BASE_CAC = MappingProxyType({
+    "software": 1200,
+    "ai_ml": 3000,
+    "fintech": 2000,
+    "healthcare": 4000,
+    "ecommerce": 300
+})
+
+# CAC adjustment by pricing model
+_PRICING_MULTIPLIERS = MappingProxyType({
+    "freemium": 0.5,
+    "subscription": 1.0,
+    "one_time": 1.5,
+    "usage_based": 0.8,
+    "enterprise": 2.0
+})
+_PRICING_MULTIPLIERS_GET = _PRICING_MULTIPLIERS.get
+
+# Preferred pricing model by industry
+_INDUSTRY_MODELS = MappingProxyType({
+    "software": "subscription",
+    "ai_ml": "usage_based",
+    "fintech": "subscription",
+    "healthcare": "subscription",
+    "ecommerce": "freemium"
+})
+_INDUSTRY_MODELS_GET = _INDUSTRY_MODELS.get
+
+# Base monthly tier pricing by industry
+_BASE_TIER_PRICES = MappingProxyType({
+    "software": MappingProxyType({"starter": 29, "pro": 99, "enterprise": 299}),
+    "ai_ml": MappingProxyType({"starter": 99, "pro": 299, "enterprise": 999}),
+    "fintech": MappingProxyType({"starter": 49, "pro": 149, "enterprise": 499}),
+    "healthcare": MappingProxyType({"starter": 199, "pro": 499, "enterprise": 1499}),
+    "ecommerce": MappingProxyType({"starter": 19, "pro": 79, "enterprise": 199})
+})
+
+# Static pricing tier definitions; the price is filled in per industry
+_FREE_TIER = MappingProxyType({
+    "name": "Free",
+    "price": 0,
+    "billing": "monthly",
+    "features": ("Basic features", "Limited usage", "Community support"),
+    "target": "Individual users, trial"
+})
+_TIER_TEMPLATES = (
+    ("starter", MappingProxyType({
+        "name": "Starter",
+        "price": 0,
+        "billing": "monthly",
+        "features": ("Core features", "Standard support", "Basic integrations"),
+        "target": "Small teams, startups"
+    })),
+    ("pro", MappingProxyType({
+        "name": "Professional",
+        "price": 0,
+        "billing": "monthly",
+        "features": ("Advanced features", "Priority support", "Full integrations", "Analytics"),
+        "target": "Growing businesses"
+    })),
+    ("enterprise", MappingProxyType({
+        "name": "Enterprise",
+        "price": 0,
+        "billing": "monthly",
+        "features": ("All features", "24/7 support", "Custom integrations", "SLA", "SSO"),
+        "target": "Large organizations"
+    })),
+)
+
+# Estimated customer distribution across tiers
+_TIER_DISTRIBUTION = MappingProxyType({
+    "Free": 0.6,
+    "Starter": 0.25,
+    "Professional": 0.12,
+    "Enterprise": 0.03
+})
+
+# Revenue projection keys per tier name, so projections need no per-call string building
+_PROJECTION_KEYS = MappingProxyType({
+    name: (f"{name.lower()}_monthly", f"{name.lower()}_annual") for name in _TIER_DISTRIBUTION
+})
+
+# Price elasticity by industry
+_ELASTICITIES = MappingProxyType({
+    "software": -1.2,
+    "ai_ml": -0.8,
+    "fintech": -1.5,
+    "healthcare": -0.6,
+    "ecommerce": -2.0
+})
+_ELASTICITIES_GET = _ELASTICITIES.get
+
+# Market data availability by industry
+_INDUSTRY_CONFIDENCE = MappingProxyType({
+    "software": 0.9,
+    "ai_ml": 0.7,
+    "fintech": 0.8,
+    "healthcare": 0.8,
+    "ecommerce": 0.9
+})
+_INDUSTRY_CONFIDENCE_GET = _INDUSTRY_CONFIDENCE.get
+
+# Struct-of-arrays view of the per-industry tables. Row i holds _INDUSTRIES[i];
+# the extra last row holds the defaults used for unknown industries.
+_INDUSTRIES = ("software", "ai_ml", "fintech", "healthcare", "ecommerce")
+_INDUSTRY_INDEX = MappingProxyType({name: i for i, name in enumerate(_INDUSTRIES)})
+_UNKNOWN_INDUSTRY = len(_INDUSTRIES)
+
+
+def _by_industry(values: Callable[[str], Any], default: Any) -> np.ndarray:
+    """Build a per-industry column with the unknown-industry default appended."""
+    return np.array([values(industry) for industry in _INDUSTRIES] + [default])
 
-@dataclass
+
+_SOFTWARE_BENCHMARKS = _INDUSTRY_BENCHMARKS["software"]
+_GROSS_MARGIN_BY_IND = _by_industry(
+    lambda i: _INDUSTRY_BENCHMARKS[i]["gross_margin"], _SOFTWARE_BENCHMARKS["gross_margin"]
+)
+_CHURN_BY_IND = _by_industry(
+    lambda i: _INDUSTRY_BENCHMARKS[i]["churn_rate_monthly"], _SOFTWARE_BENCHMARKS["churn_rate_monthly"]
+)
+_PAYBACK_BY_IND = _by_industry(
+    lambda i: _INDUSTRY_BENCHMARKS[i]["payback_months"], _SOFTWARE_BENCHMARKS["payback_months"]
+)
+_GLOBAL_MKT_BY_IND = _by_industry(
+    lambda i: _MARKET_DATA_SOURCES[i]["global_market_2024"], 100000  # Default $100B
+)
+_GROWTH_BY_IND = _by_industry(lambda i: _MARKET_DATA_SOURCES[i]["growth_rate"], 0.10)
+_CAC_BY_IND = _by_industry(_BASE_CAC.__getitem__, 1200)
+_SAM_BASE_BY_IND = _by_industry(_SAM_BASE.__getitem__, 0.10)
+_SOM_BASE_BY_IND = _by_industry(_SOM_BASE.__getitem__, 0.05)
+
+# Geographic multipliers as an array; the extra last entry is the unknown-scope default
+_GEO_SCOPES = tuple(_GEO_MULTIPLIERS)
+_GEO_INDEX = MappingProxyType({scope: i for i, scope in enumerate(_GEO_SCOPES)})
+_UNKNOWN_GEO = len(_GEO_SCOPES)
+_GEO_MULT_ARR = np.array([_GEO_MULTIPLIERS[scope] for scope in _GEO_SCOPES] + [1.0])
+
+# Relative changes applied in the unit economics sensitivity analysis
+_REVENUE_CHANGES = np.array([-0.2, -0.1, 0.1, 0.2])
+_BASE_CHURN = 0.05  # 5% monthly
+_CHURN_CHANGES = np.array([-0.02, -0.01, 0.01, 0.02])
+_CHURN_CHANGES = _CHURN_CHANGES[_BASE_CHURN + _CHURN_CHANGES > 0]
+_CHURN_RATES = _BASE_CHURN + _CHURN_CHANGES
+
+# Scenario labels, e.g. "revenue_-20%" / "churn_+1%"
+_REVENUE_SCENARIO_NAMES = tuple(
+    f"revenue_{'+' if change > 0 else ''}{int(change*100)}%" for change in _REVENUE_CHANGES.tolist()
+)
+_CHURN_SCENARIO_NAMES = tuple(
+    f"churn_{'+' if change > 0 else ''}{int(change*100)}%" for change in _CHURN_CHANGES.tolist()
+)
+
+# Market data reliability by geographic scope
+_GEO_CONFIDENCE = MappingProxyType({
+    "global": 0.6,
+    "north_america": 0.8,
+    "us_only": 0.9,
+    "europe": 0.7,
+    "asia_pacific": 0.6,
+    "emerging_markets": 0.5
+})
+_GEO_CONFIDENCE_GET = _GEO_CONFIDENCE.get
+
+
+@njit(cache=True)
+def _sensitivity_core(
+    cac: float,
+    ltv: float,
+    monthly_revenue: float,
+    gross_margin: float,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Compute revenue and churn scenario metrics (JIT-compiled when numba is installed)."""
+    revenue_factors = 1 + _REVENUE_CHANGES
+    new_revenues = monthly_revenue * revenue_factors
+    revenue_ltvs = ltv * revenue_factors
+    churn_ltvs = monthly_revenue * gross_margin * (1 / _CHURN_RATES)
+    return new_revenues, revenue_ltvs, revenue_ltvs / cac, churn_ltvs, churn_ltvs / cac
+
+
+@lru_cache(maxsize=256)
+def _market_confidence(industry: str, num_segments: int, geographic_scope: str) -> float:
+    """Confidence score for a market size estimate (pure, so cached per key)."""
+    
+    # Industry data availability
+    industry_confidence = _INDUSTRY_CONFIDENCE_GET(industry, 0.7)
+    
+    # Segment specificity
+    segment_confidence = min(0.9, 0.5 + (num_segments * 0.1))
+    
+    # Geographic scope
+    geo_confidence = _GEO_CONFIDENCE_GET(geographic_scope, 0.7)
+    
+    # Weighted average
+    confidence = (
+        industry_confidence * 0.4 +
+        segment_confidence * 0.3 +
+        geo_confidence * 0.3
+    )
+    
+    return min(0.95, confidence)
+
+
+@dataclass(slots=True)
 class MarketSizeResult:
     """Market size calculation result."""
     tam: float  # Total Addressable Market
@@ -23,7 +347,7 @@ class MarketSizeResult:
     sources: List[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class UnitEconomicsResult:
     """Unit economics calculation result."""
     cac: float  # Customer Acquisition Cost
@@ -36,7 +360,7 @@ class UnitEconomicsResult:
     sensitivity_analysis: Dict[str, Any]
 
 
-@dataclass
+@dataclass(slots=True)
 class PricingRecommendation:
     """Pricing strategy recommendation."""
     model: str  # subscription, one_time, usage_based, freemium
@@ -51,55 +375,10 @@ class BusinessModelingService:
     """Service for business model analysis and validation."""
     
     def __init__(self):
-        # Industry benchmarks (simplified - in production, use real data)
-        self.industry_benchmarks = {
-            "software": {
-                "gross_margin": 0.80,
-                "cac_ltv_ratio": 3.0,
-                "payback_months": 12,
-                "churn_rate_monthly": 0.05,
-                "pricing_multiple": 10  # Annual revenue multiple for valuation
-            },
-            "ai_ml": {
-                "gross_margin": 0.75,
-                "cac_ltv_ratio": 4.0,
-                "payback_months": 18,
-                "churn_rate_monthly": 0.03,
-                "pricing_multiple": 15
-            },
-            "fintech": {
-                "gross_margin": 0.70,
-                "cac_ltv_ratio": 3.5,
-                "payback_months": 15,
-                "churn_rate_monthly": 0.04,
-                "pricing_multiple": 12
-            },
-            "healthcare": {
-                "gross_margin": 0.65,
-                "cac_ltv_ratio": 5.0,
-                "payback_months": 24,
-                "churn_rate_monthly": 0.02,
-                "pricing_multiple": 8
-            },
-            "ecommerce": {
-                "gross_margin": 0.40,
-                "cac_ltv_ratio": 2.5,
-                "payback_months": 8,
-                "churn_rate_monthly": 0.08,
-                "pricing_multiple": 6
-            }
-        }
-        
-        # Market size data sources
-        self.market_data_sources = {
-            "software": {"global_market_2024": 650000, "growth_rate": 0.11},
-            "ai_ml": {"global_market_2024": 150000, "growth_rate": 0.35},
-            "fintech": {"global_market_2024": 310000, "growth_rate": 0.25},
-            "healthcare": {"global_market_2024": 350000, "growth_rate": 0.15},
-            "ecommerce": {"global_market_2024": 5800000, "growth_rate": 0.14}
-        }
+        self.industry_benchmarks = _INDUSTRY_BENCHMARKS
+        self.market_data_sources = _MARKET_DATA_SOURCES
     
-    async def calculate_market_size(
+    def calculate_market_size(
         self,
         industry: str,
         target_segments: List[str],
@@ -109,19 +388,19 @@ class BusinessModelingService:
         """Calculate TAM/SAM/SOM using specified methodology."""
         
         if methodology == "top_down":
-            return await self._calculate_top_down_market_size(
+            return self._calculate_top_down_market_size(
                 industry, target_segments, geographic_scope
             )
         elif methodology == "bottom_up":
-            return await self._calculate_bottom_up_market_size(
+            return self._calculate_bottom_up_market_size(
                 industry, target_segments, geographic_scope
             )
         else:
             # Hybrid approach - average of both methods
-            top_down = await self._calculate_top_down_market_size(
+            top_down = self._calculate_top_down_market_size(
                 industry, target_segments, geographic_scope
             )
-            bottom_up = await self._calculate_bottom_up_market_size(
+            bottom_up = self._calculate_bottom_up_market_size(
                 industry, target_segments, geographic_scope
             )
             
@@ -135,10 +414,85 @@ class BusinessModelingService:
                     "bottom_up": bottom_up.assumptions
                 },
                 confidence=(top_down.confidence + bottom_up.confidence) / 2,
-                sources=list(set(top_down.sources + bottom_up.sources))
+                sources=list(dict.fromkeys(top_down.sources + bottom_up.sources))
             )
     
-    async def _calculate_top_down_market_size(
+    def calculate_market_size_many(
+        self,
+        industries: List[str],
+        segments_list: List[List[str]],
+        scopes: List[str]
+    ) -> List[MarketSizeResult]:
+        """Calculate top-down TAM/SAM/SOM for a batch of (industry, segments, scope) rows.
+        
+        Produces the same results as the top-down methodology of
+        calculate_market_size, with the arithmetic done once over the whole batch.
+        """
+        count = len(industries)
+        if len(segments_list) != count or len(scopes) != count:
+            raise ValueError("industries, segments_list and scopes must have the same length")
+        
+        ind_idx = np.fromiter(
+            (_INDUSTRY_INDEX.get(industry, _UNKNOWN_INDUSTRY) for industry in industries),
+            dtype=np.intp,
+            count=count,
+        )
+        geo_idx = np.fromiter(
+            (_GEO_INDEX.get(scope, _UNKNOWN_GEO) for scope in scopes),
+            dtype=np.intp,
+            count=count,
+        )
+        segment_counts = np.fromiter(
+            (len(segments) for segments in segments_list),
+            dtype=np.int64,
+            count=count,
+        )
+        
+        global_market = _GLOBAL_MKT_BY_IND[ind_idx]
+        geo_multiplier = _GEO_MULT_ARR[geo_idx]
+        tam = global_market * geo_multiplier
+        sam_percentage = _SAM_BASE_BY_IND[ind_idx] * (1 + np.minimum(1.0, segment_counts * 0.3))
+        sam = tam * sam_percentage
+        som_percentage = _SOM_BASE_BY_IND[ind_idx]
+        som = sam * som_percentage
+        
+        results = []
+        for row in zip(
+            industries,
+            segments_list,
+            scopes,
+            global_market.tolist(),
+            _GROWTH_BY_IND[ind_idx].tolist(),
+            geo_multiplier.tolist(),
+            sam_percentage.tolist(),
+            som_percentage.tolist(),
+            tam.tolist(),
+            sam.tolist(),
+            som.tolist(),
+        ):
+            industry, segments, scope, market, growth, geo, sam_pct, som_pct, tam_i, sam_i, som_i = row
+            results.append(MarketSizeResult(
+                tam=tam_i,
+                sam=sam_i,
+                som=som_i,
+                methodology="top_down",
+                assumptions={
+                    "global_market_size_millions": market,
+                    "growth_rate": growth,
+                    "geographic_multiplier": geo,
+                    "sam_percentage": sam_pct,
+                    "som_percentage": som_pct,
+                    "target_segments": segments
+                },
+                confidence=self._calculate_market_size_confidence(
+                    industry, len(segments), scope
+                ),
+                sources=[f"{industry}_market_research", "industry_reports"]
+            ))
+        
+        return results
+    
+    def _calculate_top_down_market_size(
         self,
         industry: str,
         target_segments: List[str],
@@ -147,9 +501,9 @@ class BusinessModelingService:
         """Calculate market size using top-down approach."""
         
         # Get industry market data
-        market_data = self.market_data_sources.get(industry, {})
-        global_market = market_data.get("global_market_2024", 100000)  # Default $100B
-        growth_rate = market_data.get("growth_rate", 0.10)
+        idx = _INDUSTRY_INDEX.get(industry, _UNKNOWN_INDUSTRY)
+        global_market = _GLOBAL_MKT_BY_IND[idx].item()
+        growth_rate = _GROWTH_BY_IND[idx].item()
         
         # Geographic adjustment
         geo_multiplier = self._get_geographic_multiplier(geographic_scope)
@@ -188,7 +542,7 @@ class BusinessModelingService:
             sources=[f"{industry}_market_research", "industry_reports"]
         )
     
-    async def _calculate_bottom_up_market_size(
+    def _calculate_bottom_up_market_size(
         self,
         industry: str,
         target_segments: List[str],
@@ -240,7 +594,7 @@ class BusinessModelingService:
             sources=["customer_research", "pricing_analysis"]
         )
     
-    async def calculate_unit_economics(
+    def calculate_unit_economics(
         self,
         industry: str,
         pricing_model: str,
@@ -250,7 +604,7 @@ class BusinessModelingService:
         """Calculate unit economics including CAC, LTV, and key ratios."""
         
         # Get industry benchmarks
-        benchmarks = self.industry_benchmarks.get(industry, self.industry_benchmarks["software"])
+        benchmarks = _INDUSTRY_BENCHMARKS.get(industry, _INDUSTRY_BENCHMARKS["software"])
         
         # Use provided assumptions or defaults
         model_assumptions = assumptions or {}
@@ -299,7 +653,7 @@ class BusinessModelingService:
             sensitivity_analysis=sensitivity
         )
     
-    async def recommend_pricing_strategy(
+    def recommend_pricing_strategy(
         self,
         industry: str,
         target_segments: List[str],
@@ -342,25 +696,11 @@ class BusinessModelingService:
     
     def _get_geographic_multiplier(self, scope: str) -> float:
         """Get geographic market multiplier."""
-        multipliers = {
-            "global": 1.0,
-            "north_america": 0.35,
-            "europe": 0.25,
-            "asia_pacific": 0.30,
-            "us_only": 0.25,
-            "emerging_markets": 0.15
-        }
-        return multipliers.get(scope, 1.0)
+        return _GEO_MULTIPLIERS_GET(scope, 1.0)
     
     def _estimate_sam_percentage(self, industry: str, segments: List[str]) -> float:
         """Estimate what percentage of TAM is serviceable."""
-        base_percentage = {
-            "software": 0.15,
-            "ai_ml": 0.08,
-            "fintech": 0.12,
-            "healthcare": 0.06,
-            "ecommerce": 0.20
-        }.get(industry, 0.10)
+        base_percentage = _SAM_BASE_GET(industry, 0.10)
         
         # Adjust based on number of target segments
         segment_multiplier = min(1.0, len(segments) * 0.3)
@@ -368,13 +708,7 @@ class BusinessModelingService:
     
     def _estimate_som_percentage(self, industry: str) -> float:
         """Estimate what percentage of SAM is obtainable."""
-        return {
-            "software": 0.05,
-            "ai_ml": 0.03,
-            "fintech": 0.04,
-            "healthcare": 0.02,
-            "ecommerce": 0.08
-        }.get(industry, 0.05)
+        return _SOM_BASE_GET(industry, 0.05)
     
     def _estimate_target_customers(
         self, 
@@ -384,21 +718,11 @@ class BusinessModelingService:
     ) -> Dict[str, int]:
         """Estimate number of target customers by segment."""
         
-        # Base customer counts (simplified estimates)
-        base_counts = {
-            "enterprise": 50000,
-            "smb": 500000,
-            "startups": 100000,
-            "consumers": 10000000,
-            "developers": 25000000,
-            "agencies": 75000
-        }
-        
         geo_multiplier = self._get_geographic_multiplier(geographic_scope)
         
         estimates = {}
         for segment in segments:
-            base_count = base_counts.get(segment, 100000)
+            base_count = _BASE_CUSTOMERS.get(segment, 100000)
             estimates[segment] = int(base_count * geo_multiplier)
         
         return estimates
@@ -406,27 +730,11 @@ class BusinessModelingService:
     def _estimate_arpu(self, industry: str, segments: List[str]) -> float:
         """Estimate average revenue per user."""
         
-        # Base ARPU by industry (annual)
-        base_arpu = {
-            "software": 2400,
-            "ai_ml": 12000,
-            "fintech": 1800,
-            "healthcare": 8000,
-            "ecommerce": 600
-        }.get(industry, 2400)
+        base_arpu = _BASE_ARPU.get(industry, 2400)
         
         # Adjust based on target segments
-        segment_multipliers = {
-            "enterprise": 3.0,
-            "smb": 1.0,
-            "startups": 0.3,
-            "consumers": 0.1,
-            "developers": 0.5,
-            "agencies": 1.5
-        }
-        
         if segments:
-            avg_multiplier = sum(segment_multipliers.get(s, 1.0) for s in segments) / len(segments)
+            avg_multiplier = sum(_SEGMENT_MULTIPLIERS.get(s, 1.0) for s in segments) / len(segments)
             return base_arpu * avg_multiplier
         
         return base_arpu
@@ -439,25 +747,10 @@ class BusinessModelingService:
     ) -> float:
         """Calculate Customer Acquisition Cost."""
         
-        # Base CAC by industry
-        base_cac = {
-            "software": 1200,
-            "ai_ml": 3000,
-            "fintech": 2000,
-            "healthcare": 4000,
-            "ecommerce": 300
-        }.get(industry, 1200)
+        base_cac = _CAC_BY_IND[_INDUSTRY_INDEX.get(industry, _UNKNOWN_INDUSTRY)].item()
         
         # Adjust based on pricing model
-        pricing_multipliers = {
-            "freemium": 0.5,
-            "subscription": 1.0,
-            "one_time": 1.5,
-            "usage_based": 0.8,
-            "enterprise": 2.0
-        }
-        
-        multiplier = pricing_multipliers.get(pricing_model, 1.0)
+        multiplier = _PRICING_MULTIPLIERS_GET(pricing_model, 1.0)
         
         # Apply custom assumptions
         if "cac_multiplier" in assumptions:
@@ -504,31 +797,29 @@ class BusinessModelingService:
         """Perform sensitivity analysis on key metrics."""
         
         scenarios = {}
+        new_revenues, revenue_ltvs, revenue_ratios, churn_ltvs, churn_ratios = _sensitivity_core(
+            float(cac), float(ltv), float(monthly_revenue), float(gross_margin)
+        )
         
         # Revenue sensitivity
-        for change in [-0.2, -0.1, 0.1, 0.2]:
-            scenario_name = f"revenue_{'+' if change > 0 else ''}{int(change*100)}%"
-            new_revenue = monthly_revenue * (1 + change)
-            new_ltv = ltv * (1 + change)
+        for scenario_name, ratio, new_ltv, new_revenue in zip(
+            _REVENUE_SCENARIO_NAMES, revenue_ratios.tolist(), revenue_ltvs.tolist(), new_revenues.tolist()
+        ):
             scenarios[scenario_name] = {
-                "ltv_cac_ratio": new_ltv / cac,
+                "ltv_cac_ratio": ratio,
                 "ltv": new_ltv,
                 "monthly_revenue": new_revenue
             }
         
         # Churn sensitivity
-        base_churn = 0.05  # 5% monthly
-        for churn_change in [-0.02, -0.01, 0.01, 0.02]:
-            new_churn = base_churn + churn_change
-            if new_churn > 0:
-                scenario_name = f"churn_{'+' if churn_change > 0 else ''}{int(churn_change*100)}%"
-                new_lifetime = 1 / new_churn
-                new_ltv = monthly_revenue * gross_margin * new_lifetime
-                scenarios[scenario_name] = {
-                    "ltv_cac_ratio": new_ltv / cac,
-                    "ltv": new_ltv,
-                    "churn_rate": new_churn
-                }
+        for scenario_name, ratio, new_ltv, new_churn in zip(
+            _CHURN_SCENARIO_NAMES, churn_ratios.tolist(), churn_ltvs.tolist(), _CHURN_RATES.tolist()
+        ):
+            scenarios[scenario_name] = {
+                "ltv_cac_ratio": ratio,
+                "ltv": new_ltv,
+                "churn_rate": new_churn
+            }
         
         return scenarios
     
@@ -540,16 +831,7 @@ class BusinessModelingService:
     ) -> str:
         """Determine optimal pricing model."""
         
-        # Industry preferences
-        industry_models = {
-            "software": "subscription",
-            "ai_ml": "usage_based",
-            "fintech": "subscription",
-            "healthcare": "subscription",
-            "ecommerce": "freemium"
-        }
-        
-        base_model = industry_models.get(industry, "subscription")
+        base_model = _INDUSTRY_MODELS_GET(industry, "subscription")
         
         # Adjust based on target segments
         if "enterprise" in segments:
@@ -569,51 +851,12 @@ class BusinessModelingService:
     ) -> List[Dict[str, Any]]:
         """Generate pricing tier recommendations."""
         
-        # Base pricing by industry
-        base_prices = {
-            "software": {"starter": 29, "pro": 99, "enterprise": 299},
-            "ai_ml": {"starter": 99, "pro": 299, "enterprise": 999},
-            "fintech": {"starter": 49, "pro": 149, "enterprise": 499},
-            "healthcare": {"starter": 199, "pro": 499, "enterprise": 1499},
-            "ecommerce": {"starter": 19, "pro": 79, "enterprise": 199}
-        }
-        
-        prices = base_prices.get(industry, base_prices["software"])
+        prices = _BASE_TIER_PRICES.get(industry, _BASE_TIER_PRICES["software"])
         
-        tiers = []
+        tiers = [{**template, "price": prices[price_key]} for price_key, template in _TIER_TEMPLATES]
         
         if pricing_model == "freemium":
-            tiers.append({
-                "name": "Free",
-                "price": 0,
-                "billing": "monthly",
-                "features": ["Basic features", "Limited usage", "Community support"],
-                "target": "Individual users, trial"
-            })
-        
-        tiers.extend([
-            {
-                "name": "Starter",
-                "price": prices["starter"],
-                "billing": "monthly",
-                "features": ["Core features", "Standard support", "Basic integrations"],
-                "target": "Small teams, startups"
-            },
-            {
-                "name": "Professional",
-                "price": prices["pro"],
-                "billing": "monthly",
-                "features": ["Advanced features", "Priority support", "Full integrations", "Analytics"],
-                "target": "Growing businesses"
-            },
-            {
-                "name": "Enterprise",
-                "price": prices["enterprise"],
-                "billing": "monthly",
-                "features": ["All features", "24/7 support", "Custom integrations", "SLA", "SSO"],
-                "target": "Large organizations"
-            }
-        ])
+            tiers.insert(0, dict(_FREE_TIER))
         
         return tiers
     
@@ -627,29 +870,27 @@ class BusinessModelingService:
         # Simple revenue projection
         projections = {}
         
-        # Estimate customer distribution across tiers
-        tier_distribution = {
-            "Free": 0.6,
-            "Starter": 0.25,
-            "Professional": 0.12,
-            "Enterprise": 0.03
-        }
-        
         total_customers = 1000  # Assume 1000 customers in first year
+        total_monthly = 0.0
+        distribution_get = _TIER_DISTRIBUTION.get
+        keys_get = _PROJECTION_KEYS.get
         
         for tier in tiers:
             tier_name = tier["name"]
-            customers = total_customers * tier_distribution.get(tier_name, 0.1)
-            monthly_revenue = customers * tier["price"]
-            annual_revenue = monthly_revenue * 12
+            price = tier["price"]
+            customers = total_customers * distribution_get(tier_name, 0.1)
+            monthly_revenue = customers * price
+            total_monthly += monthly_revenue
             
-            projections[f"{tier_name.lower()}_monthly"] = monthly_revenue
-            projections[f"{tier_name.lower()}_annual"] = annual_revenue
+            keys = keys_get(tier_name)
+            if keys is None:
+                keys = (f"{tier_name.lower()}_monthly", f"{tier_name.lower()}_annual")
+            monthly_key, annual_key = keys
+            projections[monthly_key] = monthly_revenue
+            projections[annual_key] = monthly_revenue * 12
         
-        projections["total_monthly"] = sum(
-            v for k, v in projections.items() if k.endswith("_monthly")
-        )
-        projections["total_annual"] = projections["total_monthly"] * 12
+        projections["total_monthly"] = total_monthly
+        projections["total_annual"] = total_monthly * 12
         
         return projections
     
@@ -686,35 +927,27 @@ class BusinessModelingService:
             return "Pricing positioned based on value delivery and market standards."
         
         # Simple competitive analysis
-        our_mid_tier = next((t for t in tiers if t["name"] == "Professional"), tiers[1])
-        our_price = our_mid_tier["price"]
+        tiers_by_name = {tier["name"]: tier for tier in tiers}
+        our_price = tiers_by_name.get("Professional", tiers[1])["price"]
         
         # Compare with competitor average (simplified)
-        competitor_prices = [p for p in competitor_pricing.values() if isinstance(p, (int, float))]
-        if competitor_prices:
-            avg_competitor_price = sum(competitor_prices) / len(competitor_prices)
-            
-            if our_price < avg_competitor_price * 0.8:
-                return "Positioned as cost-effective alternative to competitors."
-            elif our_price > avg_competitor_price * 1.2:
-                return "Premium positioning with superior value proposition."
-            else:
-                return "Competitively positioned within market range."
-        
-        return "Pricing aligned with competitive landscape."
+        try:
+            avg_competitor_price = statistics.fmean(
+                p for p in competitor_pricing.values() if isinstance(p, (int, float))
+            )
+        except statistics.StatisticsError:
+            return "Pricing aligned with competitive landscape."
+        
+        if our_price < avg_competitor_price * 0.8:
+            return "Positioned as cost-effective alternative to competitors."
+        elif our_price > avg_competitor_price * 1.2:
+            return "Premium positioning with superior value proposition."
+        else:
+            return "Competitively positioned within market range."
     
     def _estimate_price_elasticity(self, industry: str) -> float:
         """Estimate price elasticity for the industry."""
-        
-        elasticities = {
-            "software": -1.2,
-            "ai_ml": -0.8,
-            "fintech": -1.5,
-            "healthcare": -0.6,
-            "ecommerce": -2.0
-        }
-        
-        return elasticities.get(industry, -1.0)
+        return _ELASTICITIES_GET(industry, -1.0)
     
     def _calculate_market_size_confidence(
         self, 
@@ -723,39 +956,7 @@ class BusinessModelingService:
         geographic_scope: str
     ) -> float:
         """Calculate confidence score for market size estimates."""
-        
-        base_confidence = 0.7
-        
-        # Industry data availability
-        industry_confidence = {
-            "software": 0.9,
-            "ai_ml": 0.7,
-            "fintech": 0.8,
-            "healthcare": 0.8,
-            "ecommerce": 0.9
-        }.get(industry, 0.7)
-        
-        # Segment specificity
-        segment_confidence = min(0.9, 0.5 + (num_segments * 0.1))
-        
-        # Geographic scope
-        geo_confidence = {
-            "global": 0.6,
-            "north_america": 0.8,
-            "us_only": 0.9,
-            "europe": 0.7,
-            "asia_pacific": 0.6,
-            "emerging_markets": 0.5
-        }.get(geographic_scope, 0.7)
-        
-        # Weighted average
-        confidence = (
-            industry_confidence * 0.4 +
-            segment_confidence * 0.3 +
-            geo_confidence * 0.3
-        )
-        
-        return min(0.95, confidence)
+        return _market_confidence(industry, num_segments, geographic_scope)
 
 
 # Global service instance
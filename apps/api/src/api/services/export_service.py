@@ -1,30 +1,554 @@
 """Export service for generating investor decks, product briefs, and data exports."""
 
-import json
+import asyncio
+import copy
 import csv
+import heapq
 import io
-from typing import Any, Dict, List, Optional, Union
-from datetime import datetime
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cached_property, lru_cache, partial
+from typing import IO, Any, Callable, Dict, Iterable, List, Optional, Tuple, Union
+from xml.sax.saxutils import escape
+from datetime import datetime, timezone
 from pathlib import Path
 import tempfile
+import time
 import zipfile
 
+import orjson
 import structlog
 from reportlab.lib.pagesizes import letter, A4
-from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
+from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle, StyleSheet1
 from reportlab.lib.units import inch
 from reportlab.lib.colors import HexColor
-from reportlab.platypus import SimpleDocTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, Table, TableStyle, PageBreak
 from reportlab.platypus import Image as ReportLabImage
 from reportlab.lib.enums import TA_CENTER, TA_LEFT, TA_RIGHT
-from jinja2 import Environment, BaseLoader
+from jinja2 import DictLoader, Environment, FileSystemBytecodeCache, select_autoescape
 import boto3
+import numpy as np
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
 
-from api.core.config import get_settings
+from api.core.config import settings
+
+try:
+    import weasyprint
+except ImportError:  # optional C-backed PDF engine; ReportLab is the fallback
+    weasyprint = None
 
 logger = structlog.get_logger()
-settings = get_settings()
+
+_INVESTOR_DECK_HTML = """<!DOCTYPE html>
+<html>
+<head>
+<meta charset="utf-8">
+<style>
+  @page { size: A4; margin: 72pt 72pt 18pt 72pt; }
+  body { font-family: Helvetica, Arial, sans-serif; font-size: 10pt; line-height: 1.2; }
+  section { page-break-after: always; }
+  section:last-child { page-break-after: auto; }
+  h1 { font-size: 24pt; color: #2563eb; text-align: center; margin: 0 0 30pt; }
+  h2 { font-size: 16pt; color: #1f2937; margin: 0 0 20pt; }
+  h3 { font-size: 14pt; color: #374151; border: 1pt solid #e5e7eb; padding: 8pt; margin: 0 0 12pt; }
+  table { border-collapse: collapse; margin-bottom: 15pt; }
+  th { background: #f3f4f6; color: #1f2937; text-align: left; }
+  th, td { border: 1pt solid #e5e7eb; padding: 3pt 6pt; }
+  ul { margin: 0 0 15pt; padding-left: 12pt; }
+  .title-page { padding-top: 2in; }
+  .confidential { margin-top: 1in; }
+</style>
+</head>
+<body>
+<section class="title-page">
+  <h1>AI Venture Architect</h1>
+  <h2>Product Opportunity Analysis</h2>
+  <p>Workspace: {{ workspace_info.get('name', 'Unknown') }}</p>
+  <p>Generated: {{ generated_on }}</p>
+  <p>Ideas Analyzed: {{ ideas | length }}</p>
+  <p class="confidential">Confidential &amp; Proprietary</p>
+</section>
+<section>
+  <h1>Executive Summary</h1>
+  <p>This analysis presents {{ ideas | length }} validated product opportunities identified through
+  AI-powered market research and competitive intelligence. The opportunities span multiple
+  industries and market segments, with an average attractiveness score of {{ aggregates.avg_attractiveness | score }}
+  and confidence score of {{ aggregates.avg_confidence | score }}.
+  Key highlights include emerging trends in AI/ML, fintech innovation, and productivity tools.
+  Each opportunity has been analyzed for market size, competitive positioning, technical
+  feasibility, and business model viability.</p>
+  {% if ideas %}
+  <h3>Top Opportunities</h3>
+  <table>
+    <tr><th>Rank</th><th>Product Concept</th><th>Attractiveness</th><th>Confidence</th></tr>
+    {% for idea in aggregates.sorted_top5 %}
+    <tr>
+      <td>{{ loop.index }}</td>
+      {% set title = idea.get('title', 'Untitled') %}
+      <td>{{ title[:40] }}{% if title | length > 40 %}...{% endif %}</td>
+      <td>{{ idea.get('attractiveness_score', 0) | score }}</td>
+      <td>{{ idea.get('confidence_score', 0) | score }}</td>
+    </tr>
+    {% endfor %}
+  </table>
+  {% endif %}
+</section>
+<section>
+  <h1>Market Opportunity</h1>
+  <p>The identified opportunities represent a combined Total Addressable Market (TAM) of
+  {{ aggregates.total_tam | millions }} across {{ aggregates.industries | length }} key industry segments.</p>
+  <p>Key market trends driving these opportunities include:</p>
+  <ul>
+    <li>Digital transformation acceleration</li>
+    <li>AI/ML adoption across industries</li>
+    <li>Remote work and productivity tools demand</li>
+    <li>Fintech and embedded finance growth</li>
+    <li>Healthcare digitization</li>
+  </ul>
+</section>
+{% for idea in top_ideas %}
+<section>
+  <h1>Opportunity #{{ loop.index }}: {{ idea.get('title', 'Untitled') }}</h1>
+  <h3>Overview</h3>
+  <p>{{ idea.get('description', 'No description available') }}</p>
+  <table>
+    <tr><th>Metric</th><th>Value</th></tr>
+    <tr><td>Attractiveness Score</td><td>{{ idea.get('attractiveness_score', 0) | score }}</td></tr>
+    <tr><td>Confidence Score</td><td>{{ idea.get('confidence_score', 0) | score }}</td></tr>
+    <tr><td>Market Size (TAM)</td><td>{{ idea.get('tam_sam_som', {}).get('tam', 0) | millions }}</td></tr>
+    <tr><td>Status</td><td>{{ idea.get('status', 'Unknown') }}</td></tr>
+  </table>
+  {% if idea.get('uvp') %}
+  <h3>Value Proposition</h3>
+  <p>{{ idea['uvp'] }}</p>
+  {% endif %}
+  {% if idea.get('mvp_features') %}
+  <h3>Key Features</h3>
+  <ul>{% for feature in idea['mvp_features'][:5] %}<li>{{ feature }}</li>{% endfor %}</ul>
+  {% endif %}
+</section>
+{% endfor %}
+<section>
+  <h1>Business Models</h1>
+  <h3>Revenue Model Distribution</h3>
+  <ul>{% for model, count in aggregates.revenue_models.items() %}<li>{{ model }}: {{ count }} opportunities</li>{% endfor %}</ul>
+</section>
+<section>
+  <h1>Competitive Landscape</h1>
+  <p>The competitive analysis reveals several key insights:</p>
+  <ul>
+    <li>Market fragmentation creates opportunities for consolidation</li>
+    <li>Emerging technologies enable new business models</li>
+    <li>Customer pain points remain unaddressed by existing solutions</li>
+    <li>Pricing gaps exist in multiple market segments</li>
+  </ul>
+</section>
+<section>
+  <h1>Financial Projections</h1>
+  <p>Combined Serviceable Obtainable Market (SOM): {{ aggregates.total_som | millions }}</p>
+  <p>Revenue projections are based on conservative market penetration assumptions
+  and validated pricing models. Each opportunity has been assessed for:</p>
+  <ul>
+    <li>Customer acquisition costs (CAC)</li>
+    <li>Lifetime value (LTV)</li>
+    <li>Unit economics and scalability</li>
+    <li>Funding requirements</li>
+  </ul>
+</section>
+<section>
+  <h1>Appendix</h1>
+  <h3>Methodology</h3>
+  <p>This analysis was generated using AI Venture Architect's multi-agent system:</p>
+  <ul>
+    <li>Market Research Agent: Analyzed market signals and trends</li>
+    <li>Competitive Intelligence Agent: Assessed competitive landscape</li>
+    <li>Product Ideation Agent: Generated and refined product concepts</li>
+    <li>Business Validation Agent: Evaluated business model viability</li>
+    <li>Technical Assessment Agent: Analyzed implementation feasibility</li>
+  </ul>
+  <p>All recommendations are based on real market data and validated assumptions.</p>
+</section>
+</body>
+</html>
+"""
+
+# Jinja drops the template's final newline, hence the blank line at the end
+_NOTION_MARKDOWN = """# {{ idea.get('title', 'Untitled Product Idea') }}
+
+## Overview
+{{ idea.get('description', 'No description available') }}
+
+## Unique Value Proposition
+{{ idea.get('uvp', 'Not defined') }}
+
+## Problem & Solution
+### Problem Statement
+{{ idea.get('problem_statement', 'Not defined') }}
+
+### Solution Approach  
+{{ idea.get('solution_approach', 'Not defined') }}
+
+## Target Market
+{% if idea.get('target_segments') %}### Target Segments
+{% for segment in idea['target_segments'] %}- {{ segment }}
+{% endfor %}
+{% endif %}{% if idea.get('icps') %}### Ideal Customer Profiles
+{% for profile_type, profile_desc in idea['icps'].items() %}- **{{ profile_type }}**: {{ profile_desc }}
+{% endfor %}
+{% endif %}{% if idea.get('mvp_features') %}## Product Features
+### MVP Features
+{% for feature in idea['mvp_features'] %}- {{ feature }}
+{% endfor %}
+{% endif %}{% if idea.get('tam_sam_som') %}{% set tam_sam_som = idea['tam_sam_som'] %}## Market Size
+- **TAM**: {{ tam_sam_som.get('tam', 0) | millions }}
+- **SAM**: {{ tam_sam_som.get('sam', 0) | millions }}  
+- **SOM**: {{ tam_sam_som.get('som', 0) | millions }}
+
+{% endif %}## Metrics
+- **Attractiveness Score**: {{ idea.get('attractiveness_score', 0) | score }}
+- **Confidence Score**: {{ idea.get('confidence_score', 0) | score }}
+- **Status**: {{ idea.get('status', 'Unknown') }}
+
+## Generated
+- **Created**: {{ idea.get('created_at', 'Unknown') }}
+- **AI Analysis**: Multi-agent market research and validation
+
+"""
+
+# Named export templates, compiled once per process by the shared environment below
+_TEMPLATES: Dict[str, str] = {
+    "investor_deck.html.j2": _INVESTOR_DECK_HTML,
+    "notion.md.j2": _NOTION_MARKDOWN,
+}
+
+_JINJA_ENV = Environment(
+    loader=DictLoader(_TEMPLATES),
+    autoescape=select_autoescape(enabled_extensions=("html.j2",), default_for_string=False),
+    auto_reload=False,
+    cache_size=400,
+    bytecode_cache=FileSystemBytecodeCache(),
+)
+
+
+def _setup_custom_styles(styles: StyleSheet1) -> None:
+    """Setup custom PDF styles (idempotent, since StyleSheet1.add rejects duplicates)."""
+    if 'CustomTitle' in styles.byName:
+        return
+    
+    # Title style
+    styles.add(ParagraphStyle(
+        name='CustomTitle',
+        parent=styles['Title'],
+        fontSize=24,
+        spaceAfter=30,
+        textColor=HexColor('#2563eb'),
+        alignment=TA_CENTER
+    ))
+    
+    # Subtitle style
+    styles.add(ParagraphStyle(
+        name='Subtitle',
+        parent=styles['Heading2'],
+        fontSize=16,
+        spaceAfter=20,
+        textColor=HexColor('#1f2937')
+    ))
+    
+    # Section header style
+    styles.add(ParagraphStyle(
+        name='SectionHeader',
+        parent=styles['Heading3'],
+        fontSize=14,
+        spaceAfter=12,
+        textColor=HexColor('#374151'),
+        borderWidth=1,
+        borderColor=HexColor('#e5e7eb'),
+        borderPadding=8
+    ))
+    
+    # Metric style
+    styles.add(ParagraphStyle(
+        name='Metric',
+        parent=styles['Normal'],
+        fontSize=12,
+        textColor=HexColor('#059669'),
+        alignment=TA_CENTER
+    ))
+
+
+# PDF styles are immutable once built, so every service instance shares one sheet
+_STYLES = getSampleStyleSheet()
+_setup_custom_styles(_STYLES)
+
+
+# Bound formatters for the per-idea score and market size cells
+_fmt_score = "{:.1f}/10".format
+_fmt_millions = "${:,.0f}M".format
+_JINJA_ENV.filters["score"] = _fmt_score
+_JINJA_ENV.filters["millions"] = _fmt_millions
+
+# Render investor decks with WeasyPrint (HTML/CSS, layout in C) when selected and installed
+_USE_WEASYPRINT = settings.pdf_engine == "weasyprint" and weasyprint is not None
+if settings.pdf_engine == "weasyprint" and weasyprint is None:
+    logger.warning("PDF_ENGINE=weasyprint but WeasyPrint is not installed; using ReportLab")
+
+# Multipart S3 uploads: 8 MiB parts sent in parallel once a file passes 8 MiB
+_MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=_MULTIPART_CHUNK_SIZE,
+    multipart_chunksize=_MULTIPART_CHUNK_SIZE,
+    max_concurrency=16,
+    use_threads=True,
+)
+
+# Streamed multipart uploads: parts are sent from this pool while the producer keeps
+# writing; each stream keeps at most a few parts in flight to bound its memory
+_part_upload_executor = ThreadPoolExecutor(max_workers=16, thread_name_prefix="s3-parts")
+_MAX_PARTS_IN_FLIGHT = 4
+
+# Upper bound on files a batch upload sends to S3 at the same time
+_MAX_CONCURRENT_UPLOADS = 16
+
+_JSON_BUNDLE_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NAIVE_UTC
+
+# Presigned download URLs are re-signed every few minutes; each one lives
+# settings.s3_presigned_url_ttl from the start of its window
+_PRESIGNED_URL_WINDOW = 300
+
+
+@lru_cache(maxsize=4096)
+def _signed_url(s3_client: Any, bucket: str, key: str, window: int) -> Tuple[str, datetime]:
+    """Presign a download URL shared by every caller within a window; return it with its expiry."""
+    expires_at = window * _PRESIGNED_URL_WINDOW + settings.s3_presigned_url_ttl
+    url = s3_client.generate_presigned_url(
+        'get_object',
+        Params={'Bucket': bucket, 'Key': key},
+        ExpiresIn=max(1, expires_at - int(time.time()))
+    )
+    return url, datetime.fromtimestamp(expires_at, timezone.utc)
+
+
+def _isoformat(value: Optional[datetime]) -> Optional[str]:
+    """ISO 8601 string for an optional timestamp."""
+    return value.isoformat() if value is not None else None
+
+
+# Blocking file builders below run in worker threads via asyncio.to_thread()
+def _write_temp_file(suffix: str, write: Callable[[IO[bytes]], Any]) -> Tuple[str, int]:
+    """Create a binary temporary file, fill it with ``write`` and return its path and size."""
+    tmp_file = tempfile.NamedTemporaryFile(suffix=suffix, delete=False)
+    try:
+        with tmp_file:
+            write(tmp_file)
+        return tmp_file.name, Path(tmp_file.name).stat().st_size
+    except Exception:
+        Path(tmp_file.name).unlink(missing_ok=True)
+        raise
+
+
+def _build_doc_template(tmp_file: IO[bytes], **doc_kwargs: Any) -> BaseDocTemplate:
+    """Create an A4 document with a single full-page frame and page template."""
+    doc = BaseDocTemplate(tmp_file, pagesize=A4, **doc_kwargs)
+    # Frames hold per-build layout state, so they cannot be shared between documents
+    frame = Frame(doc.leftMargin, doc.bottomMargin, doc.width, doc.height, id='normal')
+    doc.addPageTemplates([PageTemplate(id='Normal', frames=frame, pagesize=A4)])
+    return doc
+
+
+def _render_pdf(target: IO[bytes], story: List, **doc_kwargs: Any) -> int:
+    """Lay out ``story`` as an A4 PDF into ``target``; return the page count."""
+    doc = _build_doc_template(target, **doc_kwargs)
+    # build() consumes the list and marks flowables during layout; lay out shallow
+    # copies so the same story can be rendered again (e.g. after a failed upload)
+    doc.build([copy.copy(flowable) for flowable in story])
+    return doc.page
+
+
+def _build_pdf(render: Callable[[IO[bytes]], int]) -> Tuple[str, int, int]:
+    """Render a PDF into a temporary file; return its path, size and page count."""
+    page_count = 0
+    
+    def write(tmp_file: IO[bytes]) -> None:
+        nonlocal page_count
+        page_count = render(tmp_file)
+    
+    pdf_path, file_size = _write_temp_file('.pdf', write)
+    return pdf_path, file_size, page_count
+
+
+def _encode_csv_cell(value: Any) -> Any:
+    """JSON-encode complex fields; scalars are written as-is."""
+    if isinstance(value, (dict, list)):
+        return orjson.dumps(value, default=str).decode()
+    return value
+
+
+def _render_pdf_from_html(target: IO[bytes], html: str) -> int:
+    """Render HTML as a PDF into ``target`` with WeasyPrint; return the page count."""
+    document = weasyprint.HTML(string=html).render()
+    document.write_pdf(target)
+    return len(document.pages)
+
+
+def _write_csv_rows(tmp_file: IO, ideas: List[Dict[str, Any]], fields: List[str]) -> None:
+    """Write ideas as CSV rows, JSON-encoding complex fields."""
+    # Encode on top of the binary stream and flush once, instead of opening it in text mode
+    text = io.TextIOWrapper(tmp_file, encoding='utf-8', newline='')
+    writer = csv.writer(text)
+    
+    # Write header
+    writer.writerow(fields)
+    
+    # Write data in a single writerows() pass over plain row lists
+    writer.writerows(
+        [_encode_csv_cell(idea.get(field, '')) for field in fields]
+        for idea in ideas
+    )
+    text.flush()
+    text.detach()
+
+
+
+def _dump_indented(value: Any, depth: int) -> bytes:
+    """Encode ``value`` pretty-printed as if nested ``depth`` levels deep."""
+    return orjson.dumps(value, default=str, option=_JSON_BUNDLE_OPTIONS).replace(b"\n", b"\n" + b"  " * depth)
+
+
+def _write_json_bundle(tmp_file: IO, bundle: Dict[str, Any]) -> None:
+    """Stream a bundle to disk one list item at a time (same bytes as one indented dump)."""
+    tmp_file.write(b"{")
+    for i, (key, value) in enumerate(bundle.items()):
+        tmp_file.write((b",\n  " if i else b"\n  ") + orjson.dumps(key) + b": ")
+        if isinstance(value, list) and value:
+            for j, item in enumerate(value):
+                tmp_file.write((b",\n    " if j else b"[\n    ") + _dump_indented(item, 2))
+            tmp_file.write(b"\n  ]")
+        else:
+            tmp_file.write(_dump_indented(value, 1))
+    tmp_file.write(b"\n}")
+
+
+# Score columns averaged across ideas, filled in a single C-level pass
+_SCORE_DTYPE = np.dtype([('attractiveness', 'f8'), ('confidence', 'f8')])
+
+
+def _precompute_aggregates(ideas: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Compute every cross-idea aggregate the investor deck sections need in one pass."""
+    total_tam = 0
+    total_som = 0
+    industries = set()
+    revenue_models: Dict[str, int] = {}
+    
+    for idea in ideas:
+        tam_sam_som = idea.get('tam_sam_som', {})
+        total_tam += tam_sam_som.get('tam', 0)
+        total_som += tam_sam_som.get('som', 0)
+        industries.update(idea.get('target_segments', []))
+        model = idea.get('pricing_model', 'Unknown')
+        revenue_models[model] = revenue_models.get(model, 0) + 1
+    
+    avg_attractiveness = avg_confidence = 0
+    if ideas:
+        scores = np.fromiter(
+            ((idea.get('attractiveness_score', 0), idea.get('confidence_score', 0)) for idea in ideas),
+            dtype=_SCORE_DTYPE,
+            count=len(ideas)
+        )
+        avg_attractiveness = float(scores['attractiveness'].mean())
+        avg_confidence = float(scores['confidence'].mean())
+    
+    return {
+        "total_tam": total_tam,
+        "total_som": total_som,
+        "avg_attractiveness": avg_attractiveness,
+        "avg_confidence": avg_confidence,
+        "revenue_models": revenue_models,
+        "industries": industries,
+        "sorted_top5": heapq.nlargest(5, ideas, key=lambda x: x.get('attractiveness_score', 0)),
+    }
+
+
+
+class _S3MultipartWriter(io.RawIOBase):
+    """Writable binary stream that uploads to S3 in multipart parts as data arrives."""
+    
+    def __init__(self, s3_client: Any, bucket: str, key: str, part_size: int = _MULTIPART_CHUNK_SIZE):
+        super().__init__()
+        self._client = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._upload_id: Optional[str] = None
+        self._pending: deque[Future] = deque()
+        self._parts: List[Dict[str, Any]] = []
+        self._next_part = 1
+        self.bytes_written = 0
+    
+    def writable(self) -> bool:
+        return True
+    
+    def write(self, data: Any) -> int:
+        self._buffer += data
+        self.bytes_written += len(data)
+        # Renderers may hand over a whole document in one write; split it into parts
+        while len(self._buffer) >= self._part_size:
+            self._send_part(bytes(self._buffer[:self._part_size]))
+            del self._buffer[:self._part_size]
+        return len(data)
+    
+    def _send_part(self, body: bytes) -> None:
+        if self._upload_id is None:
+            self._upload_id = self._client.create_multipart_upload(
+                Bucket=self._bucket, Key=self._key
+            )["UploadId"]
+        
+        # Backpressure: wait for the oldest part before queueing another
+        if len(self._pending) >= _MAX_PARTS_IN_FLIGHT:
+            self._parts.append(self._pending.popleft().result())
+        
+        self._pending.append(_part_upload_executor.submit(self._upload_part, self._next_part, body))
+        self._next_part += 1
+    
+    def _upload_part(self, part_number: int, body: bytes) -> Dict[str, Any]:
+        response = self._client.upload_part(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            PartNumber=part_number,
+            Body=body
+        )
+        return {"ETag": response["ETag"], "PartNumber": part_number}
+    
+    def complete(self) -> None:
+        """Upload the remaining data and finish the object."""
+        if self._upload_id is None:
+            # Small object: a single PUT is cheaper than a multipart upload
+            self._client.put_object(Bucket=self._bucket, Key=self._key, Body=bytes(self._buffer))
+            self._buffer.clear()
+            return
+        
+        if self._buffer:
+            self._send_part(bytes(self._buffer))
+            self._buffer.clear()
+        while self._pending:
+            self._parts.append(self._pending.popleft().result())
+        self._client.complete_multipart_upload(
+            Bucket=self._bucket,
+            Key=self._key,
+            UploadId=self._upload_id,
+            MultipartUpload={"Parts": self._parts}
+        )
+    
+    def abort(self) -> None:
+        """Discard any uploaded parts."""
+        for future in self._pending:
+            future.cancel()
+        if self._upload_id is not None:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
 
 
 class ExportService:
@@ -40,54 +564,11 @@ class ExportService:
                 aws_secret_access_key=settings.s3_secret_key
             )
         
-        # Jinja2 environment for templates
-        self.jinja_env = Environment(loader=BaseLoader())
+        # Jinja2 environment for templates (shared, templates compile once)
+        self.jinja_env = _JINJA_ENV
         
         # PDF styles
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-    
-    def _setup_custom_styles(self):
-        """Setup custom PDF styles."""
-        # Title style
-        self.styles.add(ParagraphStyle(
-            name='CustomTitle',
-            parent=self.styles['Title'],
-            fontSize=24,
-            spaceAfter=30,
-            textColor=HexColor('#2563eb'),
-            alignment=TA_CENTER
-        ))
-        
-        # Subtitle style
-        self.styles.add(ParagraphStyle(
-            name='Subtitle',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            spaceAfter=20,
-            textColor=HexColor('#1f2937')
-        ))
-        
-        # Section header style
-        self.styles.add(ParagraphStyle(
-            name='SectionHeader',
-            parent=self.styles['Heading3'],
-            fontSize=14,
-            spaceAfter=12,
-            textColor=HexColor('#374151'),
-            borderWidth=1,
-            borderColor=HexColor('#e5e7eb'),
-            borderPadding=8
-        ))
-        
-        # Metric style
-        self.styles.add(ParagraphStyle(
-            name='Metric',
-            parent=self.styles['Normal'],
-            fontSize=12,
-            textColor=HexColor('#059669'),
-            alignment=TA_CENTER
-        ))
+        self.styles = _STYLES
     
     async def export_investor_deck(
         self,
@@ -98,90 +579,102 @@ class ExportService:
         """Generate investor deck PDF."""
         
         config = export_config or {}
-        
-        # Create temporary file
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-            pdf_path = tmp_file.name
+        pdf_path = None
+        now = datetime.utcnow()
         
         try:
-            # Generate PDF
-            doc = SimpleDocTemplate(
-                pdf_path,
-                pagesize=A4,
-                rightMargin=72,
-                leftMargin=72,
-                topMargin=72,
-                bottomMargin=18
-            )
-            
-            story = []
-            
-            # Title page
-            story.extend(self._create_title_page(workspace_info, ideas))
-            story.append(PageBreak())
-            
-            # Executive summary
-            story.extend(self._create_executive_summary(ideas))
-            story.append(PageBreak())
-            
-            # Market opportunity
-            story.extend(self._create_market_opportunity_section(ideas))
-            story.append(PageBreak())
-            
-            # Product concepts
-            for i, idea in enumerate(ideas[:5]):  # Limit to top 5 ideas
-                story.extend(self._create_product_section(idea, i + 1))
-                if i < len(ideas) - 1:
-                    story.append(PageBreak())
-            
-            # Business model
-            story.append(PageBreak())
-            story.extend(self._create_business_model_section(ideas))
-            
-            # Competitive analysis
-            story.append(PageBreak())
-            story.extend(self._create_competitive_section(ideas))
-            
-            # Financial projections
-            story.append(PageBreak())
-            story.extend(self._create_financial_section(ideas))
+            top_ideas = ideas[:5]  # Limit to top 5 ideas
+            aggregates = _precompute_aggregates(ideas)
+            if _USE_WEASYPRINT:
+                html = _JINJA_ENV.get_template("investor_deck.html.j2").render(
+                    ideas=ideas,
+                    top_ideas=top_ideas,
+                    aggregates=aggregates,
+                    workspace_info=workspace_info,
+                    generated_on=now.strftime('%B %d, %Y')
+                )
+                render = partial(_render_pdf_from_html, html=html)
+            else:
+                render = self._build_investor_deck_reportlab(
+                    ideas, top_ideas, aggregates, workspace_info, now
+                )
             
-            # Appendix
-            story.append(PageBreak())
-            story.extend(self._create_appendix(ideas))
-            
-            # Build PDF
-            doc.build(story)
-            
-            # Upload to S3 if configured
-            s3_url = None
-            if self.s3_client:
-                s3_key = f"exports/investor-deck-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.pdf"
-                s3_url = await self._upload_to_s3(pdf_path, s3_key)
-            
-            # Get file size
-            file_size = Path(pdf_path).stat().st_size
+            s3_key = f"exports/investor-deck-{now.strftime('%Y%m%d-%H%M%S')}.pdf"
+            pdf_path, s3_url, s3_url_expires_at, file_size, page_count = await self._export_pdf(render, s3_key)
             
             return {
                 "type": "investor_deck",
                 "format": "pdf",
                 "file_path": pdf_path,
                 "s3_url": s3_url,
+                "s3_url_expires_at": _isoformat(s3_url_expires_at),
                 "file_size": file_size,
-                "page_count": len(story),
-                "generated_at": datetime.utcnow().isoformat(),
+                "page_count": page_count,
+                "generated_at": now.isoformat(),
                 "ideas_included": len(ideas)
             }
             
         except Exception as e:
             logger.error(f"Failed to generate investor deck: {e}")
             # Clean up temp file
-            try:
-                Path(pdf_path).unlink()
-            except:
-                pass
+            if pdf_path:
+                Path(pdf_path).unlink(missing_ok=True)
             raise
     
+    def _build_investor_deck_reportlab(
+        self,
+        ideas: List[Dict[str, Any]],
+        top_ideas: List[Dict[str, Any]],
+        aggregates: Dict[str, Any],
+        workspace_info: Dict[str, Any],
+        now: datetime
+    ) -> Callable[[IO[bytes]], int]:
+        """Assemble the investor deck story; return a ReportLab renderer for it."""
+        story = []
+        
+        # Title page
+        story.extend(self._create_title_page(workspace_info, ideas, now))
+        story.append(PageBreak())
+        
+        # Executive summary
+        story.extend(self._create_executive_summary(ideas, aggregates))
+        story.append(PageBreak())
+        
+        # Market opportunity
+        story.extend(self._create_market_opportunity_section(ideas, aggregates))
+        story.append(PageBreak())
+        
+        # Product concepts
+        for i, idea in enumerate(top_ideas):
+            story.extend(self._create_product_section(idea, i + 1))
+            if i < len(ideas) - 1:
+                story.append(PageBreak())
+        
+        # Business model
+        story.append(PageBreak())
+        story.extend(self._create_business_model_section(ideas, aggregates))
+        
+        # Competitive analysis
+        story.append(PageBreak())
+        story.extend(self._create_competitive_section(ideas))
+        
+        # Financial projections
+        story.append(PageBreak())
+        story.extend(self._create_financial_section(ideas, aggregates))
+        
+        # Appendix
+        story.append(PageBreak())
+        story.extend(self._create_appendix(ideas))
+        
+        return partial(
+            _render_pdf,
+            story=story,
+            rightMargin=72,
+            leftMargin=72,
+            topMargin=72,
+            bottomMargin=18
+        )
+    
     async def export_product_brief(
         self,
         idea: Dict[str, Any],
@@ -190,12 +683,10 @@ class ExportService:
         """Generate detailed product brief PDF."""
         
         config = export_config or {}
-        
-        with tempfile.NamedTemporaryFile(suffix='.pdf', delete=False) as tmp_file:
-            pdf_path = tmp_file.name
+        pdf_path = None
+        now = datetime.utcnow()
         
         try:
-            doc = SimpleDocTemplate(pdf_path, pagesize=A4)
             story = []
             
             # Title
@@ -242,32 +733,26 @@ class ExportService:
             # Sources and citations
             story.extend(self._create_sources_section(idea))
             
-            doc.build(story)
-            
-            # Upload to S3 if configured
-            s3_url = None
-            if self.s3_client:
-                s3_key = f"exports/product-brief-{idea.get('id', 'unknown')}-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.pdf"
-                s3_url = await self._upload_to_s3(pdf_path, s3_key)
-            
-            file_size = Path(pdf_path).stat().st_size
+            s3_key = f"exports/product-brief-{idea.get('id', 'unknown')}-{now.strftime('%Y%m%d-%H%M%S')}.pdf"
+            pdf_path, s3_url, s3_url_expires_at, file_size, _ = await self._export_pdf(
+                partial(_render_pdf, story=story), s3_key
+            )
             
             return {
                 "type": "product_brief",
                 "format": "pdf",
                 "file_path": pdf_path,
                 "s3_url": s3_url,
+                "s3_url_expires_at": _isoformat(s3_url_expires_at),
                 "file_size": file_size,
-                "generated_at": datetime.utcnow().isoformat(),
+                "generated_at": now.isoformat(),
                 "idea_id": idea.get('id')
             }
             
         except Exception as e:
             logger.error(f"Failed to generate product brief: {e}")
-            try:
-                Path(pdf_path).unlink()
-            except:
-                pass
+            if pdf_path:
+                Path(pdf_path).unlink(missing_ok=True)
             raise
     
     async def export_csv_data(
@@ -282,40 +767,36 @@ class ExportService:
             'id', 'title', 'description', 'uvp', 'attractiveness_score',
             'confidence_score', 'status', 'created_at'
         ])
+        now = datetime.utcnow()
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.csv', delete=False, newline='') as tmp_file:
-            csv_path = tmp_file.name
-            writer = csv.DictWriter(tmp_file, fieldnames=fields)
-            
-            # Write header
-            writer.writeheader()
-            
-            # Write data
-            for idea in ideas:
-                row = {}
-                for field in fields:
-                    value = idea.get(field, '')
-                    # Handle complex fields
-                    if isinstance(value, (dict, list)):
-                        value = json.dumps(value)
-                    row[field] = value
-                writer.writerow(row)
-        
-        # Upload to S3 if configured
-        s3_url = None
+        # Stream straight to S3 if configured; keep a local file only without S3
+        s3_url = s3_url_expires_at = None
+        csv_path = None
         if self.s3_client:
-            s3_key = f"exports/ideas-data-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.csv"
-            s3_url = await self._upload_to_s3(csv_path, s3_key)
-        
-        file_size = Path(csv_path).stat().st_size
+            s3_key = f"exports/ideas-data-{now.strftime('%Y%m%d-%H%M%S')}.csv"
+            try:
+                file_size, _ = await asyncio.to_thread(
+                    self._stream_to_s3, s3_key, lambda target: _write_csv_rows(target, ideas, fields)
+                )
+                s3_url, s3_url_expires_at = self._presigned_url(s3_key)
+            except ClientError as e:
+                logger.error(f"Failed to stream CSV to S3: {e}")
+        
+        if s3_url is None:
+            csv_path, file_size = await asyncio.to_thread(
+                _write_temp_file,
+                '.csv',
+                lambda tmp_file: _write_csv_rows(tmp_file, ideas, fields)
+            )
         
         return {
             "type": "csv_export",
             "format": "csv",
             "file_path": csv_path,
             "s3_url": s3_url,
+            "s3_url_expires_at": _isoformat(s3_url_expires_at),
             "file_size": file_size,
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": now.isoformat(),
             "record_count": len(ideas),
             "fields": fields
         }
@@ -328,9 +809,10 @@ class ExportService:
     ) -> Dict[str, Any]:
         """Export complete data bundle as JSON."""
         
+        now = datetime.utcnow()
         bundle = {
             "export_info": {
-                "generated_at": datetime.utcnow().isoformat(),
+                "generated_at": now.isoformat(),
                 "version": "1.0",
                 "workspace": workspace_info,
                 "total_ideas": len(ideas)
@@ -342,25 +824,26 @@ class ExportService:
             }
         }
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as tmp_file:
-            json_path = tmp_file.name
-            json.dump(bundle, tmp_file, indent=2, default=str)
+        json_path, file_size = await asyncio.to_thread(
+            _write_temp_file,
+            '.json',
+            lambda tmp_file: _write_json_bundle(tmp_file, bundle)
+        )
         
         # Upload to S3 if configured
-        s3_url = None
+        s3_url = s3_url_expires_at = None
         if self.s3_client:
-            s3_key = f"exports/data-bundle-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.json"
-            s3_url = await self._upload_to_s3(json_path, s3_key)
-        
-        file_size = Path(json_path).stat().st_size
+            s3_key = f"exports/data-bundle-{now.strftime('%Y%m%d-%H%M%S')}.json"
+            s3_url, s3_url_expires_at = await self._upload_to_s3(json_path, s3_key)
         
         return {
             "type": "json_bundle",
             "format": "json",
             "file_path": json_path,
             "s3_url": s3_url,
+            "s3_url_expires_at": _isoformat(s3_url_expires_at),
             "file_size": file_size,
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": now.isoformat(),
             "ideas_count": len(ideas)
         }
     
@@ -371,34 +854,44 @@ class ExportService:
     ) -> Dict[str, Any]:
         """Generate Notion-compatible markdown."""
         
+        now = datetime.utcnow()
+        
         # Create Notion-style markdown
         markdown_content = self._generate_notion_markdown(idea)
         
-        with tempfile.NamedTemporaryFile(mode='w', suffix='.md', delete=False) as tmp_file:
-            md_path = tmp_file.name
-            tmp_file.write(markdown_content)
+        md_path, file_size = await asyncio.to_thread(
+            _write_temp_file,
+            '.md',
+            lambda tmp_file: tmp_file.write(markdown_content.encode())
+        )
         
         # Upload to S3 if configured
-        s3_url = None
+        s3_url = s3_url_expires_at = None
         if self.s3_client:
-            s3_key = f"exports/notion-{idea.get('id', 'unknown')}-{datetime.utcnow().strftime('%Y%m%d-%H%M%S')}.md"
-            s3_url = await self._upload_to_s3(md_path, s3_key)
-        
-        file_size = Path(md_path).stat().st_size
+            s3_key = f"exports/notion-{idea.get('id', 'unknown')}-{now.strftime('%Y%m%d-%H%M%S')}.md"
+            s3_url, s3_url_expires_at = await self._upload_to_s3(md_path, s3_key)
         
         return {
             "type": "notion_page",
             "format": "markdown",
             "file_path": md_path,
             "s3_url": s3_url,
+            "s3_url_expires_at": _isoformat(s3_url_expires_at),
             "file_size": file_size,
-            "generated_at": datetime.utcnow().isoformat(),
+            "generated_at": now.isoformat(),
             "idea_id": idea.get('id'),
             "content": markdown_content
         }
     
+    def _bullets(self, items: Iterable[str]) -> List:
+        """Render bullet items as a single Paragraph joined with line breaks."""
+        lines = [f"• {escape(str(item))}" for item in items]
+        if not lines:
+            return []
+        return [Paragraph("<br/>".join(lines), self.styles['Normal'])]
+    
     # PDF section generators
-    def _create_title_page(self, workspace_info: Dict[str, Any], ideas: List[Dict[str, Any]]) -> List:
+    def _create_title_page(self, workspace_info: Dict[str, Any], ideas: List[Dict[str, Any]], now: datetime) -> List:
         """Create title page for investor deck."""
         story = []
         
@@ -408,7 +901,7 @@ class ExportService:
         story.append(Spacer(1, 0.5*inch))
         
         story.append(Paragraph(f"Workspace: {workspace_info.get('name', 'Unknown')}", self.styles['Normal']))
-        story.append(Paragraph(f"Generated: {datetime.utcnow().strftime('%B %d, %Y')}", self.styles['Normal']))
+        story.append(Paragraph(f"Generated: {now.strftime('%B %d, %Y')}", self.styles['Normal']))
         story.append(Paragraph(f"Ideas Analyzed: {len(ideas)}", self.styles['Normal']))
         
         story.append(Spacer(1, 1*inch))
@@ -416,7 +909,7 @@ class ExportService:
         
         return story
     
-    def _create_executive_summary(self, ideas: List[Dict[str, Any]]) -> List:
+    def _create_executive_summary(self, ideas: List[Dict[str, Any]], aggregates: Dict[str, Any]) -> List:
         """Create executive summary section."""
         story = []
         
@@ -424,8 +917,8 @@ class ExportService:
         story.append(Spacer(1, 20))
         
         # Key metrics
-        avg_attractiveness = sum(idea.get('attractiveness_score', 0) for idea in ideas) / len(ideas) if ideas else 0
-        avg_confidence = sum(idea.get('confidence_score', 0) for idea in ideas) / len(ideas) if ideas else 0
+        avg_attractiveness = aggregates["avg_attractiveness"]
+        avg_confidence = aggregates["avg_confidence"]
         
         summary_text = f"""
         This analysis presents {len(ideas)} validated product opportunities identified through 
@@ -447,13 +940,12 @@ class ExportService:
             
             table_data = [['Rank', 'Product Concept', 'Attractiveness', 'Confidence']]
             
-            sorted_ideas = sorted(ideas, key=lambda x: x.get('attractiveness_score', 0), reverse=True)
-            for i, idea in enumerate(sorted_ideas[:5]):
+            for i, idea in enumerate(aggregates["sorted_top5"]):
                 table_data.append([
                     str(i + 1),
                     idea.get('title', 'Untitled')[:40] + ('...' if len(idea.get('title', '')) > 40 else ''),
-                    f"{idea.get('attractiveness_score', 0):.1f}/10",
-                    f"{idea.get('confidence_score', 0):.1f}/10"
+                    _fmt_score(idea.get('attractiveness_score', 0)),
+                    _fmt_score(idea.get('confidence_score', 0))
                 ])
             
             table = Table(table_data, colWidths=[0.5*inch, 3*inch, 1*inch, 1*inch])
@@ -472,7 +964,7 @@ class ExportService:
         
         return story
     
-    def _create_market_opportunity_section(self, ideas: List[Dict[str, Any]]) -> List:
+    def _create_market_opportunity_section(self, ideas: List[Dict[str, Any]], aggregates: Dict[str, Any]) -> List:
         """Create market opportunity section."""
         story = []
         
@@ -480,14 +972,8 @@ class ExportService:
         story.append(Spacer(1, 20))
         
         # Aggregate market data
-        total_tam = sum(
-            idea.get('tam_sam_som', {}).get('tam', 0) 
-            for idea in ideas
-        )
-        
-        industries = set()
-        for idea in ideas:
-            industries.update(idea.get('target_segments', []))
+        total_tam = aggregates["total_tam"]
+        industries = aggregates["industries"]
         
         market_text = f"""
         The identified opportunities represent a combined Total Addressable Market (TAM) of 
@@ -520,9 +1006,9 @@ class ExportService:
         # Key metrics
         metrics_data = [
             ['Metric', 'Value'],
-            ['Attractiveness Score', f"{idea.get('attractiveness_score', 0):.1f}/10"],
-            ['Confidence Score', f"{idea.get('confidence_score', 0):.1f}/10"],
-            ['Market Size (TAM)', f"${idea.get('tam_sam_som', {}).get('tam', 0):,.0f}M"],
+            ['Attractiveness Score', _fmt_score(idea.get('attractiveness_score', 0))],
+            ['Confidence Score', _fmt_score(idea.get('confidence_score', 0))],
+            ['Market Size (TAM)', _fmt_millions(idea.get('tam_sam_som', {}).get('tam', 0))],
             ['Status', idea.get('status', 'Unknown')]
         ]
         
@@ -547,13 +1033,12 @@ class ExportService:
         # MVP features
         if idea.get('mvp_features'):
             story.append(Paragraph("Key Features", self.styles['SectionHeader']))
-            for feature in idea['mvp_features'][:5]:
-                story.append(Paragraph(f"• {feature}", self.styles['Normal']))
+            story.extend(self._bullets(idea['mvp_features'][:5]))
             story.append(Spacer(1, 15))
         
         return story
     
-    def _create_business_model_section(self, ideas: List[Dict[str, Any]]) -> List:
+    def _create_business_model_section(self, ideas: List[Dict[str, Any]], aggregates: Dict[str, Any]) -> List:
         """Create business model section."""
         story = []
         
@@ -561,19 +1046,21 @@ class ExportService:
         story.append(Spacer(1, 20))
         
         # Revenue model distribution
-        revenue_models = {}
-        for idea in ideas:
-            model = idea.get('pricing_model', 'Unknown')
-            revenue_models[model] = revenue_models.get(model, 0) + 1
+        revenue_models = aggregates["revenue_models"]
         
         story.append(Paragraph("Revenue Model Distribution", self.styles['SectionHeader']))
-        for model, count in revenue_models.items():
-            story.append(Paragraph(f"• {model}: {count} opportunities", self.styles['Normal']))
+        story.extend(self._bullets(f"{model}: {count} opportunities" for model, count in revenue_models.items()))
         
         return story
     
     def _create_competitive_section(self, ideas: List[Dict[str, Any]]) -> List:
         """Create competitive analysis section."""
+        # Per-call shallow copies keep layout state off the shared, pre-parsed flowables
+        return [copy.copy(flowable) for flowable in self._competitive_flowables]
+    
+    @cached_property
+    def _competitive_flowables(self) -> Tuple:
+        """Competitive analysis boilerplate, parsed once (it does not depend on the ideas)."""
         story = []
         
         story.append(Paragraph("Competitive Landscape", self.styles['CustomTitle']))
@@ -590,9 +1077,9 @@ class ExportService:
         
         story.append(Paragraph(competitive_text, self.styles['Normal']))
         
-        return story
+        return tuple(story)
     
-    def _create_financial_section(self, ideas: List[Dict[str, Any]]) -> List:
+    def _create_financial_section(self, ideas: List[Dict[str, Any]], aggregates: Dict[str, Any]) -> List:
         """Create financial projections section."""
         story = []
         
@@ -600,10 +1087,7 @@ class ExportService:
         story.append(Spacer(1, 20))
         
         # Aggregate financial data
-        total_som = sum(
-            idea.get('tam_sam_som', {}).get('som', 0) 
-            for idea in ideas
-        )
+        total_som = aggregates["total_som"]
         
         financial_text = f"""
         Combined Serviceable Obtainable Market (SOM): ${total_som:,.0f}M
@@ -623,6 +1107,11 @@ class ExportService:
     
     def _create_appendix(self, ideas: List[Dict[str, Any]]) -> List:
         """Create appendix section."""
+        return [copy.copy(flowable) for flowable in self._appendix_flowables]
+    
+    @cached_property
+    def _appendix_flowables(self) -> Tuple:
+        """Appendix boilerplate, parsed once (it does not depend on the ideas)."""
         story = []
         
         story.append(Paragraph("Appendix", self.styles['CustomTitle']))
@@ -644,7 +1133,7 @@ class ExportService:
         
         story.append(Paragraph(methodology_text, self.styles['Normal']))
         
-        return story
+        return tuple(story)
     
     # Helper methods for product brief sections
     def _create_target_market_section(self, idea: Dict[str, Any]) -> List:
@@ -656,14 +1145,14 @@ class ExportService:
             
             if idea.get('target_segments'):
                 story.append(Paragraph("Target Segments:", self.styles['Normal']))
-                for segment in idea['target_segments']:
-                    story.append(Paragraph(f"• {segment}", self.styles['Normal']))
+                story.extend(self._bullets(idea['target_segments']))
                 story.append(Spacer(1, 10))
             
             if idea.get('icps'):
                 story.append(Paragraph("Ideal Customer Profiles:", self.styles['Normal']))
-                for profile_type, profile_desc in idea['icps'].items():
-                    story.append(Paragraph(f"• {profile_type}: {profile_desc}", self.styles['Normal']))
+                story.extend(self._bullets(
+                    f"{profile_type}: {profile_desc}" for profile_type, profile_desc in idea['icps'].items()
+                ))
                 story.append(Spacer(1, 15))
         
         return story
@@ -675,8 +1164,7 @@ class ExportService:
         if idea.get('mvp_features'):
             story.append(Paragraph("Product Features", self.styles['SectionHeader']))
             story.append(Paragraph("MVP Features:", self.styles['Normal']))
-            for feature in idea['mvp_features']:
-                story.append(Paragraph(f"• {feature}", self.styles['Normal']))
+            story.extend(self._bullets(idea['mvp_features']))
             story.append(Spacer(1, 15))
         
         return story
@@ -693,9 +1181,11 @@ class ExportService:
         if idea.get('tam_sam_som'):
             tam_sam_som = idea['tam_sam_som']
             story.append(Paragraph("Market Size:", self.styles['Normal']))
-            story.append(Paragraph(f"• TAM: ${tam_sam_som.get('tam', 0):,.0f}M", self.styles['Normal']))
-            story.append(Paragraph(f"• SAM: ${tam_sam_som.get('sam', 0):,.0f}M", self.styles['Normal']))
-            story.append(Paragraph(f"• SOM: ${tam_sam_som.get('som', 0):,.0f}M", self.styles['Normal']))
+            story.extend(self._bullets([
+                "TAM: " + _fmt_millions(tam_sam_som.get('tam', 0)),
+                "SAM: " + _fmt_millions(tam_sam_som.get('sam', 0)),
+                "SOM: " + _fmt_millions(tam_sam_som.get('som', 0))
+            ]))
         
         story.append(Spacer(1, 15))
         return story
@@ -709,19 +1199,20 @@ class ExportService:
             
             if idea.get('tech_stack'):
                 story.append(Paragraph("Technology Stack:", self.styles['Normal']))
+                tech_lines = []
                 tech_stack = idea['tech_stack']
                 for category, technologies in tech_stack.items():
                     if isinstance(technologies, list):
                         tech_list = ', '.join(technologies)
                     else:
                         tech_list = str(technologies)
-                    story.append(Paragraph(f"• {category}: {tech_list}", self.styles['Normal']))
+                    tech_lines.append(f"{category}: {tech_list}")
+                story.extend(self._bullets(tech_lines))
                 story.append(Spacer(1, 10))
             
             if idea.get('technical_risks'):
                 story.append(Paragraph("Technical Risks:", self.styles['Normal']))
-                for risk in idea['technical_risks']:
-                    story.append(Paragraph(f"• {risk}", self.styles['Normal']))
+                story.extend(self._bullets(idea['technical_risks']))
                 story.append(Spacer(1, 15))
         
         return story
@@ -735,19 +1226,20 @@ class ExportService:
             
             if idea.get('risks'):
                 story.append(Paragraph("Business Risks:", self.styles['Normal']))
+                risk_lines = []
                 risks = idea['risks']
                 for risk_category, risk_items in risks.items():
                     if isinstance(risk_items, list):
                         for risk_item in risk_items:
-                            story.append(Paragraph(f"• {risk_category}: {risk_item}", self.styles['Normal']))
+                            risk_lines.append(f"{risk_category}: {risk_item}")
                     else:
-                        story.append(Paragraph(f"• {risk_category}: {risk_items}", self.styles['Normal']))
+                        risk_lines.append(f"{risk_category}: {risk_items}")
+                story.extend(self._bullets(risk_lines))
                 story.append(Spacer(1, 10))
             
             if idea.get('compliance_notes'):
                 story.append(Paragraph("Compliance Requirements:", self.styles['Normal']))
-                for note in idea['compliance_notes']:
-                    story.append(Paragraph(f"• {note}", self.styles['Normal']))
+                story.extend(self._bullets(idea['compliance_notes']))
                 story.append(Spacer(1, 15))
         
         return story
@@ -761,8 +1253,9 @@ class ExportService:
             
             if idea.get('citations'):
                 story.append(Paragraph("Analysis Sources:", self.styles['Normal']))
-                for source_type, citation in idea['citations'].items():
-                    story.append(Paragraph(f"• {source_type}: {citation}", self.styles['Normal']))
+                story.extend(self._bullets(
+                    f"{source_type}: {citation}" for source_type, citation in idea['citations'].items()
+                ))
                 story.append(Spacer(1, 10))
             
             if idea.get('sources'):
@@ -773,84 +1266,82 @@ class ExportService:
     
     def _generate_notion_markdown(self, idea: Dict[str, Any]) -> str:
         """Generate Notion-compatible markdown for an idea."""
+        return self.jinja_env.get_template("notion.md.j2").render(idea=idea)
+    
+    def _stream_to_s3(self, s3_key: str, write: Callable[[IO[bytes]], Any]) -> Tuple[int, Any]:
+        """Write an export straight into a multipart upload; return its size and ``write``'s result."""
+        upload = _S3MultipartWriter(self.s3_client, settings.s3_bucket, s3_key)
+        try:
+            result = write(upload)
+            upload.complete()
+        except BaseException:
+            upload.abort()
+            raise
+        return upload.bytes_written, result
+    
+    async def _export_pdf(
+        self,
+        render: Callable[[IO[bytes]], int],
+        s3_key: str
+    ) -> Tuple[Optional[str], Optional[str], Optional[datetime], int, int]:
+        """Render a PDF into S3 if configured, else a temp file; return path, URL, URL expiry, size and pages."""
+        if self.s3_client:
+            try:
+                file_size, page_count = await asyncio.to_thread(self._stream_to_s3, s3_key, render)
+                return None, *self._presigned_url(s3_key), file_size, page_count
+            except ClientError as e:
+                logger.error(f"Failed to stream PDF to S3: {e}")
         
-        markdown = f"""# {idea.get('title', 'Untitled Product Idea')}
-
-## Overview
-{idea.get('description', 'No description available')}
-
-## Unique Value Proposition
-{idea.get('uvp', 'Not defined')}
-
-## Problem & Solution
-### Problem Statement
-{idea.get('problem_statement', 'Not defined')}
-
-### Solution Approach  
-{idea.get('solution_approach', 'Not defined')}
-
-## Target Market
-"""
-        
-        if idea.get('target_segments'):
-            markdown += "### Target Segments\n"
-            for segment in idea['target_segments']:
-                markdown += f"- {segment}\n"
-            markdown += "\n"
-        
-        if idea.get('icps'):
-            markdown += "### Ideal Customer Profiles\n"
-            for profile_type, profile_desc in idea['icps'].items():
-                markdown += f"- **{profile_type}**: {profile_desc}\n"
-            markdown += "\n"
-        
-        if idea.get('mvp_features'):
-            markdown += "## Product Features\n### MVP Features\n"
-            for feature in idea['mvp_features']:
-                markdown += f"- {feature}\n"
-            markdown += "\n"
-        
-        if idea.get('tam_sam_som'):
-            tam_sam_som = idea['tam_sam_som']
-            markdown += f"""## Market Size
-- **TAM**: ${tam_sam_som.get('tam', 0):,.0f}M
-- **SAM**: ${tam_sam_som.get('sam', 0):,.0f}M  
-- **SOM**: ${tam_sam_som.get('som', 0):,.0f}M
-
-"""
-        
-        markdown += f"""## Metrics
-- **Attractiveness Score**: {idea.get('attractiveness_score', 0):.1f}/10
-- **Confidence Score**: {idea.get('confidence_score', 0):.1f}/10
-- **Status**: {idea.get('status', 'Unknown')}
-
-## Generated
-- **Created**: {idea.get('created_at', 'Unknown')}
-- **AI Analysis**: Multi-agent market research and validation
-"""
-        
-        return markdown
+        pdf_path, file_size, page_count = await asyncio.to_thread(_build_pdf, render)
+        return pdf_path, None, None, file_size, page_count
+    
+    def _presigned_url(self, s3_key: str) -> Tuple[str, datetime]:
+        """Generate presigned download URL; return it with the time it stops working."""
+        window = int(time.time()) // _PRESIGNED_URL_WINDOW
+        return _signed_url(self.s3_client, settings.s3_bucket, s3_key, window)
     
-    async def _upload_to_s3(self, file_path: str, s3_key: str) -> Optional[str]:
-        """Upload file to S3 and return URL."""
+    async def _upload_to_s3(
+        self,
+        file_path: str,
+        s3_key: str
+    ) -> Tuple[Optional[str], Optional[datetime]]:
+        """Upload file to S3 and return its URL and URL expiry."""
         if not self.s3_client:
-            return None
+            return None, None
         
         try:
-            self.s3_client.upload_file(file_path, settings.s3_bucket, s3_key)
-            
-            # Generate presigned URL (valid for 7 days)
-            url = self.s3_client.generate_presigned_url(
-                'get_object',
-                Params={'Bucket': settings.s3_bucket, 'Key': s3_key},
-                ExpiresIn=7*24*3600  # 7 days
+            # boto3 blocks for the whole transfer, so keep it off the event loop
+            await asyncio.to_thread(
+                self.s3_client.upload_file,
+                file_path,
+                settings.s3_bucket,
+                s3_key,
+                Config=_TRANSFER_CONFIG
             )
-            
-            return url
+            return self._presigned_url(s3_key)
             
         except ClientError as e:
             logger.error(f"Failed to upload to S3: {e}")
-            return None
+            return None, None
+    
+    async def upload_many(
+        self,
+        uploads: Iterable[Tuple[str, str]]
+    ) -> Dict[str, Tuple[Optional[str], Optional[datetime]]]:
+        """Upload ``(file_path, s3_key)`` pairs concurrently; return URLs and expiries by key."""
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_UPLOADS)
+        
+        async def upload(file_path: str, s3_key: str) -> Tuple[str, Tuple[Optional[str], Optional[datetime]]]:
+            async with semaphore:
+                return s3_key, await self._upload_to_s3(file_path, s3_key)
+        
+        # The next upload starts as soon as any one finishes, not per fixed batch
+        tasks = [asyncio.create_task(upload(file_path, s3_key)) for file_path, s3_key in uploads]
+        urls: Dict[str, Tuple[Optional[str], Optional[datetime]]] = {}
+        for finished in asyncio.as_completed(tasks):
+            s3_key, url = await finished
+            urls[s3_key] = url
+        return urls
 
 
 # Global service instance
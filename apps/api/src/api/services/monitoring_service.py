@@ -2,12 +2,16 @@
 
 import time
 import asyncio
-from typing import Any, Dict, List, Optional, Callable
+from bisect import bisect_left
+from itertools import islice
+from operator import gt, itemgetter, lt
+from typing import Any, Dict, List, Optional, Callable, Tuple
 from datetime import datetime, timedelta
 from collections import defaultdict, deque
 from dataclasses import dataclass, field
 import statistics
 
+import numpy as np
 import structlog
 from prometheus_client import Counter, Histogram, Gauge, Summary
 import psutil
@@ -15,6 +19,71 @@ import psutil
 logger = structlog.get_logger()
 
 
+# Most recent response times kept per endpoint for percentile calculation
+_RESPONSE_TIME_WINDOW = 1000
+
+
+def _response_time_percentiles(times: deque) -> Tuple[float, float, float]:
+    """p50/p95/p99 of a response time window, exact and in one pass over a float array.
+    
+    The Weibull method matches statistics.quantiles' default exclusive method; tail
+    percentiles fall back to the window maximum until there are enough samples.
+    """
+    arr = np.fromiter(times, dtype=np.float64, count=len(times))
+    p50, p95, p99 = np.percentile(arr, (50, 95, 99), method="weibull").tolist()
+    peak = float(arr.max())
+    return p50, (p95 if len(arr) > 20 else peak), (p99 if len(arr) > 100 else peak)
+
+
+class _MeasurementRing:
+    """Fixed-size history of (timestamp, value) SLO measurements in parallel numpy arrays."""
+    
+    __slots__ = ("_capacity", "_timestamps", "_values", "_head", "_size")
+    
+    def __init__(self, capacity: int = 1440):
+        self._capacity = capacity
+        # Every sample is stored twice, so the newest `capacity` samples are always
+        # one contiguous, chronological slice and never need to be reassembled
+        self._timestamps = np.empty(2 * capacity, dtype="datetime64[us]")
+        self._values = np.empty(2 * capacity, dtype=np.float64)
+        self._head = 0
+        self._size = 0
+    
+    def __len__(self) -> int:
+        return self._size
+    
+    def append(self, timestamp: datetime, value: float) -> None:
+        head = self._head
+        self._timestamps[head] = self._timestamps[head + self._capacity] = timestamp
+        self._values[head] = self._values[head + self._capacity] = value
+        self._head = (head + 1) % self._capacity
+        self._size = min(self._size + 1, self._capacity)
+    
+    def since(self, start: datetime) -> np.ndarray:
+        """Values measured at or after ``start``, oldest first."""
+        end = self._head + self._capacity
+        begin = end - self._size
+        offset = np.searchsorted(self._timestamps[begin:end], np.datetime64(start, "us"))
+        return self._values[begin + offset:end]
+
+
+def _bound(children: Dict[Tuple[str, ...], Any], metric: Any, *labels: str) -> Any:
+    """Return the labelled child of ``metric``, binding it once per label combination."""
+    child = children.get(labels)
+    if child is None:
+        child = children[labels] = metric.labels(*labels)
+    return child
+
+
+def _sample_system() -> Tuple[Any, Any, Any]:
+    """Read memory, disk and network counters in one blocking call."""
+    return (
+        psutil.virtual_memory(),
+        psutil.disk_usage('/'),
+        psutil.net_io_counters()
+    )
+
+
 @dataclass
 class SLOTarget:
     """SLO target definition."""
@@ -24,6 +93,12 @@ class SLOTarget:
     unit: str
     measurement_window_minutes: int = 60
     alert_threshold: float = 0.9  # Alert when SLO is at 90% of target
+    lower_is_better: bool = True
+    is_violation: Callable[[float, float], bool] = field(init=False, repr=False)
+    
+    def __post_init__(self):
+        # (current_value, target_value) -> whether the SLO is breached
+        self.is_violation = gt if self.lower_is_better else lt
 
 
 @dataclass
@@ -105,6 +180,13 @@ class MonitoringService:
             ['service']
         )
         
+        # Labelled metric children, bound on first use instead of per request
+        self._request_duration_children: Dict[Tuple[str, ...], Any] = {}
+        self._request_count_children: Dict[Tuple[str, ...], Any] = {}
+        self._search_duration_children: Dict[Tuple[str, ...], Any] = {}
+        self._idea_generation_duration_children: Dict[Tuple[str, ...], Any] = {}
+        self._export_duration_children: Dict[Tuple[str, ...], Any] = {}
+        
         # SLO definitions
         self.slo_targets = {
             "search_p95": SLOTarget(
@@ -140,7 +222,8 @@ class MonitoringService:
                 description="API availability percentage",
                 target_value=99.9,  # percent
                 unit="percent",
-                measurement_window_minutes=60
+                measurement_window_minutes=60,
+                lower_is_better=False
             ),
             "error_rate": SLOTarget(
                 name="error_rate",
@@ -153,17 +236,20 @@ class MonitoringService:
         
         # Performance tracking
         self.performance_history = deque(maxlen=1440)  # 24 hours of minute-by-minute data
-        self.response_times = defaultdict(lambda: deque(maxlen=1000))
+        self.response_times = defaultdict(lambda: deque(maxlen=_RESPONSE_TIME_WINDOW))
         self.error_counts = defaultdict(int)
         self.request_counts = defaultdict(int)
         
         # SLO tracking
-        self.slo_measurements = defaultdict(lambda: deque(maxlen=1440))
-        self.slo_violations = defaultdict(list)
+        self.slo_measurements = defaultdict(_MeasurementRing)
+        self.slo_violations = defaultdict(lambda: deque(maxlen=10_000))  # (detected_at, violation) in time order
         
         # Background monitoring task
         self.monitoring_task = None
         self.is_monitoring = False
+        
+        # Prime the CPU counters: non-blocking cpu_percent() reports usage since the previous call
+        psutil.cpu_percent(interval=None)
     
     async def start_monitoring(self):
         """Start background monitoring."""
@@ -189,16 +275,13 @@ class MonitoringService:
         """Background monitoring loop."""
         while self.is_monitoring:
             try:
-                # Collect performance metrics
-                metrics = await self._collect_performance_metrics()
+                # Sample the system in a worker thread while SLOs are evaluated on the loop
+                metrics, _ = await asyncio.gather(
+                    self._collect_performance_metrics(),
+                    self._evaluate_slos()
+                )
                 self.performance_history.append(metrics)
                 
-                # Update SLO measurements
-                await self._update_slo_measurements()
-                
-                # Check for SLO violations
-                await self._check_slo_violations()
-                
                 # Sleep for 1 minute
                 await asyncio.sleep(60)
                 
@@ -208,11 +291,11 @@ class MonitoringService:
     
     async def _collect_performance_metrics(self) -> PerformanceMetrics:
         """Collect current performance metrics."""
-        # System metrics
-        cpu_usage = psutil.cpu_percent(interval=1)
-        memory = psutil.virtual_memory()
-        disk = psutil.disk_usage('/')
-        network = psutil.net_io_counters()
+        # System metrics. cpu_percent(interval=None) does not block, and psutil tracks its
+        # previous reading per thread, so it must run on the loop thread that __init__ primed;
+        # the other psutil reads hit /proc synchronously and go to a worker thread.
+        cpu_usage = psutil.cpu_percent(interval=None)
+        memory, disk, network = await asyncio.to_thread(_sample_system)
         
         # Application metrics
         response_times = {}
@@ -222,9 +305,11 @@ class MonitoringService:
         # Calculate response time percentiles
         for endpoint, times in self.response_times.items():
             if times:
-                response_times[f"{endpoint}_p50"] = statistics.median(times)
-                response_times[f"{endpoint}_p95"] = statistics.quantiles(times, n=20)[18] if len(times) > 20 else max(times)
-                response_times[f"{endpoint}_p99"] = statistics.quantiles(times, n=100)[98] if len(times) > 100 else max(times)
+                (
+                    response_times[f"{endpoint}_p50"],
+                    response_times[f"{endpoint}_p95"],
+                    response_times[f"{endpoint}_p99"],
+                ) = _response_time_percentiles(times)
         
         # Calculate error rates
         for service in ["api", "search", "ideation", "export"]:
@@ -253,39 +338,44 @@ class MonitoringService:
             throughput=throughput
         )
     
+    async def _evaluate_slos(self):
+        """Update SLO measurements, then check them for violations."""
+        await self._update_slo_measurements()
+        await self._check_slo_violations()
+    
     async def _update_slo_measurements(self):
         """Update SLO measurements."""
         current_time = datetime.utcnow()
         
         # Search P95
-        search_times = list(self.response_times.get("search", []))
+        search_times = self.response_times.get("search")
         if search_times:
-            p95 = statistics.quantiles(search_times, n=20)[18] if len(search_times) > 20 else max(search_times)
-            self.slo_measurements["search_p95"].append((current_time, p95))
+            _, p95, _ = _response_time_percentiles(search_times)
+            self.slo_measurements["search_p95"].append(current_time, p95)
         
         # Idea generation P95
-        idea_times = list(self.response_times.get("idea_generation", []))
+        idea_times = self.response_times.get("idea_generation")
         if idea_times:
-            p95 = statistics.quantiles(idea_times, n=20)[18] if len(idea_times) > 20 else max(idea_times)
-            self.slo_measurements["idea_generation_p95"].append((current_time, p95))
+            _, p95, _ = _response_time_percentiles(idea_times)
+            self.slo_measurements["idea_generation_p95"].append(current_time, p95)
         
         # Export P95
-        export_times = list(self.response_times.get("export", []))
+        export_times = self.response_times.get("export")
         if export_times:
-            p95 = statistics.quantiles(export_times, n=20)[18] if len(export_times) > 20 else max(export_times)
-            self.slo_measurements["export_p95"].append((current_time, p95))
+            _, p95, _ = _response_time_percentiles(export_times)
+            self.slo_measurements["export_p95"].append(current_time, p95)
         
         # API availability (based on error rate)
         total_requests = sum(self.request_counts.values())
         total_errors = sum(self.error_counts.values())
         if total_requests > 0:
             availability = ((total_requests - total_errors) / total_requests) * 100
-            self.slo_measurements["api_availability"].append((current_time, availability))
+            self.slo_measurements["api_availability"].append(current_time, availability)
         
         # Overall error rate
         if total_requests > 0:
             error_rate = (total_errors / total_requests) * 100
-            self.slo_measurements["error_rate"].append((current_time, error_rate))
+            self.slo_measurements["error_rate"].append(current_time, error_rate)
     
     async def _check_slo_violations(self):
         """Check for SLO violations and trigger alerts."""
@@ -298,31 +388,16 @@ class MonitoringService:
             
             # Get measurements within the window
             window_start = current_time - timedelta(minutes=target.measurement_window_minutes)
-            recent_measurements = [
-                (timestamp, value) for timestamp, value in measurements
-                if timestamp >= window_start
-            ]
+            values = measurements.since(window_start)
             
-            if not recent_measurements:
+            if not values.size:
                 continue
             
             # Calculate current value
-            values = [value for _, value in recent_measurements]
-            current_value = statistics.mean(values)
+            current_value = float(values.mean())
             
             # Check for violation
-            is_violation = False
-            if slo_name in ["search_p95", "idea_generation_p95", "export_p95", "data_freshness"]:
-                # Lower is better
-                is_violation = current_value > target.target_value
-            elif slo_name in ["api_availability"]:
-                # Higher is better
-                is_violation = current_value < target.target_value
-            elif slo_name in ["error_rate"]:
-                # Lower is better
-                is_violation = current_value > target.target_value
-            
-            if is_violation:
+            if target.is_violation(current_value, target.target_value):
                 violation = {
                     "timestamp": current_time.isoformat(),
                     "slo_name": slo_name,
@@ -331,7 +406,11 @@ class MonitoringService:
                     "severity": "critical" if current_value > target.target_value * 1.5 else "warning"
                 }
                 
-                self.slo_violations[slo_name].append(violation)
+                # Drop violations that have left the SLO window before recording the new one
+                violations = self.slo_violations[slo_name]
+                while violations and violations[0][0] < window_start:
+                    violations.popleft()
+                violations.append((current_time, violation))
                 
                 # Trigger alert
                 await self._trigger_slo_alert(violation)
@@ -352,17 +431,9 @@ class MonitoringService:
     def record_request(self, method: str, endpoint: str, duration: float, status_code: int):
         """Record HTTP request metrics."""
         # Update Prometheus metrics
-        self.request_duration.labels(
-            method=method,
-            endpoint=endpoint,
-            status_code=str(status_code)
-        ).observe(duration)
-        
-        self.request_count.labels(
-            method=method,
-            endpoint=endpoint,
-            status_code=str(status_code)
-        ).inc()
+        labels = (method, endpoint, str(status_code))
+        _bound(self._request_duration_children, self.request_duration, *labels).observe(duration)
+        _bound(self._request_count_children, self.request_count, *labels).inc()
         
         # Update internal tracking
         self.response_times[endpoint].append(duration)
@@ -373,7 +444,7 @@ class MonitoringService:
     
     def record_search_request(self, search_type: str, duration: float, success: bool):
         """Record search request metrics."""
-        self.search_duration.labels(search_type=search_type).observe(duration)
+        _bound(self._search_duration_children, self.search_duration, search_type).observe(duration)
         self.response_times["search"].append(duration)
         self.request_counts["search"] += 1
         
@@ -382,7 +453,7 @@ class MonitoringService:
     
     def record_idea_generation(self, method: str, duration: float, success: bool):
         """Record idea generation metrics."""
-        self.idea_generation_duration.labels(method=method).observe(duration)
+        _bound(self._idea_generation_duration_children, self.idea_generation_duration, method).observe(duration)
         self.response_times["idea_generation"].append(duration)
         self.request_counts["ideation"] += 1
         
@@ -391,7 +462,7 @@ class MonitoringService:
     
     def record_export_request(self, export_type: str, duration: float, success: bool):
         """Record export request metrics."""
-        self.export_duration.labels(export_type=export_type).observe(duration)
+        _bound(self._export_duration_children, self.export_duration, export_type).observe(duration)
         self.response_times["export"].append(duration)
         self.request_counts["export"] += 1
         
@@ -401,7 +472,7 @@ class MonitoringService:
     def update_data_freshness(self, source: str, hours_old: float):
         """Update data freshness metric."""
         self.data_freshness.labels(source=source).set(hours_old)
-        self.slo_measurements["data_freshness"].append((datetime.utcnow(), hours_old))
+        self.slo_measurements["data_freshness"].append(datetime.utcnow(), hours_old)
     
     def update_active_users(self, count: int):
         """Update active users count."""
@@ -431,20 +502,15 @@ class MonitoringService:
             
             # Get recent measurements
             window_start = current_time - timedelta(minutes=target.measurement_window_minutes)
-            recent_measurements = [
-                (timestamp, value) for timestamp, value in measurements
-                if timestamp >= window_start
-            ]
+            values = measurements.since(window_start)
             
-            if not recent_measurements:
+            if not values.size:
                 continue
             
-            values = [value for _, value in recent_measurements]
-            current_value = statistics.mean(values)
+            current_value = float(values.mean())
             
             # Calculate compliance
-            if slo_name in ["search_p95", "idea_generation_p95", "export_p95", "data_freshness", "error_rate"]:
-                # Lower is better
+            if target.lower_is_better:
                 compliance = min(100.0, (target.target_value / max(current_value, 0.001)) * 100)
             else:
                 # Higher is better (availability)
@@ -460,8 +526,8 @@ class MonitoringService:
             
             # Calculate trend
             if len(values) >= 10:
-                recent_avg = statistics.mean(values[-5:])
-                older_avg = statistics.mean(values[-10:-5])
+                recent_avg = values[-5:].mean()
+                older_avg = values[-10:-5].mean()
                 
                 if recent_avg < older_avg * 0.95:
                     trend = "improving"
@@ -472,11 +538,10 @@ class MonitoringService:
             else:
                 trend = "stable"
             
-            # Get recent violations
-            recent_violations = [
-                v for v in self.slo_violations[slo_name]
-                if datetime.fromisoformat(v["timestamp"]) >= window_start
-            ]
+            # Get recent violations: they are stored in time order, so the window is a suffix
+            violations = self.slo_violations[slo_name]
+            start = bisect_left(violations, window_start, key=itemgetter(0))
+            recent_violations = [violation for _, violation in islice(violations, start, None)]
             
             status = SLOStatus(
                 name=slo_name,
@@ -542,7 +607,7 @@ class MonitoringService:
         
         # System health
         try:
-            cpu_usage = psutil.cpu_percent(interval=1)
+            cpu_usage = psutil.cpu_percent(interval=None)
             memory = psutil.virtual_memory()
             disk = psutil.disk_usage('/')
             
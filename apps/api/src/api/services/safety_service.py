@@ -10,10 +10,9 @@ import structlog
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, and_, func
 
-from api.core.config import get_settings
+from api.core.config import settings
 
 logger = structlog.get_logger()
-settings = get_settings()
 
 
 @dataclass
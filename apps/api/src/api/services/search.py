@@ -12,13 +12,12 @@ from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select, text, and_, or_
 from sqlalchemy.orm import selectinload
 
-from api.core.config import get_settings
+from api.core.config import settings
 from api.core.database import get_db
 from api.models.signal import Signal
 from api.models.workspace import Workspace
 
 logger = structlog.get_logger()
-settings = get_settings()
 
 
 class HybridSearchService:
@@ -60,6 +59,13 @@ class HybridSearchService:
             logger.error(f"Failed to initialize search service: {e}")
             raise
     
+    async def close(self):
+        """Release the OpenSearch connection pool."""
+        if self.opensearch_client is not None:
+            await self.opensearch_client.close()
+            self.opensearch_client = None
+        self._initialized = False
+    
     async def _ensure_index_exists(self):
         """Ensure OpenSearch index exists with proper mapping."""
         index_name = "signals"
@@ -195,7 +201,7 @@ class HybridSearchService:
             reranked_results = await self._rerank_results(query, combined_results[:limit * 2])
             
             # Step 5: Get full signal data from database
-            final_results = await self._enrich_results(reranked_results[:limit])
+            final_results = await self._enrich_results(workspace_id, reranked_results[:limit])
             
             return final_results
             
@@ -443,6 +449,7 @@ class HybridSearchService:
     
     async def _enrich_results(
         self,
+        workspace_id: UUID,
         results: List[Dict[str, Any]]
     ) -> List[Dict[str, Any]]:
         """Enrich results with full signal data from database."""
@@ -453,7 +460,10 @@ class HybridSearchService:
         
         # Get full signal data
         async with AsyncSession(bind=None) as session:  # This needs proper session handling
-            query = select(Signal).where(Signal.id.in_(signal_ids))
+            query = select(Signal).where(
+                Signal.workspace_id == workspace_id,
+                Signal.id.in_(signal_ids),
+            )
             result = await session.execute(query)
             signals = result.scalars().all()
             
@@ -473,7 +483,7 @@ class HybridSearchService:
                         "source": signal.source,
                         "url": signal.url,
                         "entities": signal.entities or {},
-                        "metadata": signal.metadata or {},
+                        "metadata": signal.meta or {},
                         "created_at": signal.created_at.isoformat(),
                         "published_at": signal.published_at.isoformat() if signal.published_at else None,
                         "search_score": result["final_score"],
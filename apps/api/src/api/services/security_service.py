@@ -13,10 +13,9 @@ import boto3
 from botocore.exceptions import ClientError
 import structlog
 
-from api.core.config import get_settings
+from api.core.config import settings
 
 logger = structlog.get_logger()
-settings = get_settings()
 
 
 class SecurityService:
@@ -160,7 +160,7 @@ async def test_signals(db_session: AsyncSession, test_workspace: Workspace) -> l
             content=data["content"],
             url=data["url"],
             entities=data["entities"],
-            metadata=data["metadata"]
+            meta=data["metadata"]
         )
         signals.append(signal)
         db_session.add(signal)
@@ -0,0 +1,63 @@
+"""Tests for authentication helpers."""
+
+import pytest
+from uuid import uuid4
+
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from api.core import auth
+from api.core.auth import AuthUser, AuthWorkspace
+from api.models.user import User, UserRole
+
+
+class TestAuth:
+    """Test cases for the auth dependencies' row types and checks."""
+    
+    def test_module_imports(self):
+        """Test the auth module exposes the row types its dependencies return."""
+        assert AuthUser._fields == ("id", "email", "is_active")
+        assert AuthWorkspace._fields == ("id", "user_id", "workspace_id", "role")
+        assert len(auth._AUTH_USER_COLS) == auth._AUTH_USER_WIDTH == len(AuthUser._fields)
+        assert len(auth._AUTH_WORKSPACE_COLS) == len(AuthWorkspace._fields)
+    
+    def test_check_user(self):
+        """Test missing and inactive users are rejected."""
+        user = AuthUser(uuid4(), "user@example.com", True)
+        assert auth._check_user(user) is user
+        
+        with pytest.raises(HTTPException) as exc_info:
+            auth._check_user(None)
+        assert exc_info.value.status_code == 401
+        
+        with pytest.raises(HTTPException) as exc_info:
+            auth._check_user(user._replace(is_active=False))
+        assert exc_info.value.detail == "Inactive user"
+    
+    def test_workspace_role(self):
+        """Test workspace rows carry the role enum used by require_role."""
+        workspace = AuthWorkspace(uuid4(), uuid4(), uuid4(), UserRole.ADMIN)
+        assert auth.require_role("member")(workspace) is workspace
+    
+    @pytest.mark.asyncio
+    async def test_user_cache_holds_plain_rows(self):
+        """Test cached users are column tuples, not session-bound ORM objects."""
+        engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+        async with engine.begin() as conn:
+            await conn.run_sync(User.__table__.create)
+        
+        user_id = uuid4()
+        async with AsyncSession(engine) as session:
+            session.add(User(id=user_id, email="user@example.com", full_name="User"))
+            await session.commit()
+            user = await auth._get_user_cached(session, user_id)
+        
+        try:
+            assert user == AuthUser(user_id, "user@example.com", True)
+            assert auth._user_cache[user_id] is user
+            
+            # Served from the cache once the originating session is gone
+            assert await auth._get_user_cached(None, user_id) is user
+        finally:
+            auth.invalidate_user_cache(user_id)
+            await engine.dispose()
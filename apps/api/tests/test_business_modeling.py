@@ -2,6 +2,8 @@
 
 import pytest
 import pytest_asyncio
+import msgspec
+import orjson
 from unittest.mock import Mock, patch
 
 from api.services.business_modeling import BusinessModelingService, MarketSizeResult, UnitEconomicsResult
@@ -15,10 +17,9 @@ class TestBusinessModelingService:
         """Create business modeling service instance."""
         return BusinessModelingService()
     
-    @pytest.mark.asyncio
-    async def test_calculate_market_size_top_down(self, service):
+    def test_calculate_market_size_top_down(self, service):
         """Test top-down market size calculation."""
-        result = await service._calculate_top_down_market_size(
+        result = service._calculate_top_down_market_size(
             industry="software",
             target_segments=["enterprise", "smb"],
             geographic_scope="global"
@@ -33,10 +34,9 @@ class TestBusinessModelingService:
         assert result.methodology == "top_down"
         assert result.confidence > 0
     
-    @pytest.mark.asyncio
-    async def test_calculate_market_size_bottom_up(self, service):
+    def test_calculate_market_size_bottom_up(self, service):
         """Test bottom-up market size calculation."""
-        result = await service._calculate_bottom_up_market_size(
+        result = service._calculate_bottom_up_market_size(
             industry="ai_ml",
             target_segments=["startups", "enterprise"],
             geographic_scope="north_america"
@@ -50,10 +50,9 @@ class TestBusinessModelingService:
         assert "customer_segments" in result.assumptions
         assert "total_target_customers" in result.assumptions
     
-    @pytest.mark.asyncio
-    async def test_calculate_market_size_hybrid(self, service):
+    def test_calculate_market_size_hybrid(self, service):
         """Test hybrid market size calculation."""
-        result = await service.calculate_market_size(
+        result = service.calculate_market_size(
             industry="fintech",
             target_segments=["smb", "consumers"],
             geographic_scope="global",
@@ -66,8 +65,20 @@ class TestBusinessModelingService:
         assert "bottom_up" in result.assumptions
         assert result.confidence > 0
     
-    @pytest.mark.asyncio
-    async def test_calculate_unit_economics(self, service):
+    def test_calculate_market_size_many(self, service):
+        """Test batched market size calculation matches the per-row top-down path."""
+        industries = ["software", "ai_ml", "unknown_industry"]
+        segments_list = [["enterprise", "smb"], [], ["startups", "developers", "agencies", "smb"]]
+        scopes = ["global", "north_america", "unknown_scope"]
+        
+        results = service.calculate_market_size_many(industries, segments_list, scopes)
+        
+        assert len(results) == 3
+        for result, industry, segments, scope in zip(results, industries, segments_list, scopes):
+            expected = service._calculate_top_down_market_size(industry, segments, scope)
+            assert result == expected
+    
+    def test_calculate_unit_economics(self, service):
         """Test unit economics calculation."""
         assumptions = {
             "monthly_revenue_per_customer": 100,
@@ -76,7 +87,7 @@ class TestBusinessModelingService:
             "cac_multiplier": 1.2
         }
         
-        result = await service.calculate_unit_economics(
+        result = service.calculate_unit_economics(
             industry="software",
             pricing_model="subscription",
             customer_segments=["smb"],
@@ -91,15 +102,14 @@ class TestBusinessModelingService:
         assert result.gross_margin == 0.8
         assert len(result.sensitivity_analysis) > 0
     
-    @pytest.mark.asyncio
-    async def test_recommend_pricing_strategy(self, service):
+    def test_recommend_pricing_strategy(self, service):
         """Test pricing strategy recommendation."""
         competitor_pricing = {
             "competitor_a": {"starter": 29, "pro": 99},
             "competitor_b": {"basic": 19, "premium": 79}
         }
         
-        result = await service.recommend_pricing_strategy(
+        result = service.recommend_pricing_strategy(
             industry="software",
             target_segments=["smb", "enterprise"],
             competitor_pricing=competitor_pricing,
@@ -280,6 +290,31 @@ class TestBusinessModelingService:
         assert 0 <= low_confidence <= 1
         assert high_confidence > low_confidence
     
+    def test_results_are_isolated(self, service):
+        """Test results share no mutable state with callers or later calls."""
+        segments = ["smb"]
+        first = service.calculate_market_size("software", segments)
+        
+        segments.append("enterprise")
+        first.sources.append("caller note")
+        first.assumptions["target_segments"].append("consumers")
+        
+        again = service.calculate_market_size("software", ["smb"])
+        assert again == service.calculate_market_size("software", ["smb"])
+        assert "caller note" not in again.sources
+        assert again.assumptions["target_segments"] == ["smb"]
+    
+    def test_results_serialize_natively(self, service):
+        """Test result dataclasses serialize without an asdict() round-trip."""
+        results = [
+            service.calculate_market_size("software", ["enterprise", "smb"], "global", "hybrid"),
+            service.calculate_unit_economics("ai_ml", "usage_based", ["enterprise"], {}),
+            service.recommend_pricing_strategy("fintech", ["smb"], {"competitor": 99}),
+        ]
+        
+        for result in results:
+            assert orjson.loads(orjson.dumps(result)) == msgspec.json.decode(msgspec.json.encode(result))
+    
     def test_categorize_prices(self, service):
         """Test price categorization."""
         prices = [5, 25, 75, 150, 750]